@@ -1,11 +1,13 @@
-"""Background thread loops for stats logging and WebSocket keepalive."""
+"""Background thread loops for publishing, stats logging and WebSocket keepalive."""
 from __future__ import annotations
 
 import logging
+import queue
 import time
 from time import sleep
 from typing import Any, TYPE_CHECKING
 
+from . import message_parser
 from . import topics
 from .mqtt_publish import publish_status
 
@@ -15,6 +17,25 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def publisher_loop(state: BridgeState) -> None:
+    """Parse queued serial lines and publish them to MQTT.
+
+    Runs off the main loop so a slow broker never delays draining the
+    serial port. Keeps going after shutdown is requested until the queue
+    is empty; _cleanup() bounds how long it waits for that.
+    """
+    while not state.should_exit or not state.line_queue.empty():
+        try:
+            line = state.line_queue.get(timeout=0.5)
+        except queue.Empty:
+            continue
+
+        try:
+            message_parser.parse_and_publish(state, line)
+        except Exception as e:
+            logger.exception(f"Error publishing serial line: {e}")
+
+
 def stats_logging_loop(state: BridgeState) -> None:
     """Log statistics every 5 minutes."""
     stats_interval = 300
@@ -31,7 +52,7 @@ def stats_logging_loop(state: BridgeState) -> None:
             device_stats = state.device.get_device_stats()
             if device_stats:
                 state.stats['device'] = device_stats
-                logger.debug(f"[STATS] Updated device stats: {device_stats}")
+                logger.debug("[STATS] Updated device stats: %s", device_stats)
                 publish_status(state, "online")
             else:
                 logger.debug("[STATS] No device stats received")
@@ -93,6 +114,7 @@ def stats_logging_loop(state: BridgeState) -> None:
             f"MQTT: {connected_brokers}/{total_brokers} | "
             f"Reconnects/24h: {reconnect_str} | "
             f"Failures: {state.stats['publish_failures']}"
+            + (f" | Dropped lines: {state.stats['lines_dropped']}" if state.stats['lines_dropped'] else "")
         )
 
         # Log device stats separately if available
@@ -185,6 +207,6 @@ def websocket_ping_loop(state: BridgeState, broker_idx: int, broker_client: Any,
                 sock = raw_client._sock
                 if hasattr(sock, 'ping'):
                     sock.ping()
-                    logger.debug(f"[{broker_idx}] Sent WebSocket PING")
+                    logger.debug("[%s] Sent WebSocket PING", broker_idx)
         except Exception as e:
-            logger.debug(f"[{broker_idx}] WebSocket PING failed: {e}")
+            logger.debug("[%s] WebSocket PING failed: %s", broker_idx, e)
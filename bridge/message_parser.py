@@ -15,13 +15,39 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
-RAW_PATTERN = re.compile(r"(\d{2}:\d{2}:\d{2}) - (\d{1,2}/\d{1,2}/\d{4}) U RAW: (.*)")
+# re.ASCII: the firmware only emits ASCII digits, and \d then stays a plain
+# [0-9] class instead of consulting the Unicode digit tables.
+RAW_PATTERN = re.compile(r"(\d{2}:\d{2}:\d{2}) - (\d{1,2}/\d{1,2}/\d{4}) U RAW: (.*)", re.ASCII)
+# Numeric and hash runs are possessive (++): each is followed by a literal
+# that cannot be a digit, so giving characters back could never help, and a
+# malformed line fails without retrying shorter runs.
 PACKET_PATTERN = re.compile(
-    r"(\d{2}:\d{2}:\d{2}) - (\d{1,2}/\d{1,2}/\d{4}) U: (RX|TX), len=(\d+) \(type=(\d+), route=([A-Z]), payload_len=(\d+)\)"
-    r"(?: SNR=(-?\d+) RSSI=(-?\d+) score=(\d+)(?: time=(\d+))?)?"
-    r"(?: hash=([0-9A-F]+))?"
-    r"(?: \[(.*)\])?$"
+    r"(\d{2}:\d{2}:\d{2}) - (\d{1,2}/\d{1,2}/\d{4}) U: (RX|TX), len=(\d++) \(type=(\d++), route=([A-Z]), payload_len=(\d++)\)"
+    r"(?: SNR=(-?\d++) RSSI=(-?\d++) score=(\d++)(?: time=(\d++))?)?"
+    r"(?: hash=([0-9A-F]++))?"
+    r"(?: \[(.*)\])?$",
+    re.ASCII,
 )
+# Every RX/TX packet line carries this marker; checking for it first lets
+# RAW, DEBUG and other chatter skip the regex entirely.
+PACKET_MARKER = " U: "
+
+
+def encode_message(state: BridgeState, body: dict) -> str:
+    """JSON-encode *body* behind the origin/origin_id envelope.
+
+    The envelope is encoded once per (name, pubkey) and cached on the state,
+    so only the per-line fields go through the encoder. The result is
+    identical to ``json.dumps({"origin": ..., "origin_id": ..., **body})``.
+    """
+    cache_key = (state.repeater_name, state.repeater_pub_key)
+    prefix = state.origin_json_cache.get(cache_key)
+    if prefix is None:
+        prefix = json.dumps({"origin": cache_key[0], "origin_id": cache_key[1]})[:-1]
+        state.origin_json_cache[cache_key] = prefix
+    if not body:
+        return prefix + "}"
+    return prefix + ", " + json.dumps(body)[1:]
 
 
 def parse_and_publish(state: BridgeState, line: str) -> None:
@@ -29,13 +55,7 @@ def parse_and_publish(state: BridgeState, line: str) -> None:
     if not line:
         return
 
-    logger.debug(f"From Radio: {line}")
-
-    message: dict = {
-        "origin": state.repeater_name,
-        "origin_id": state.repeater_pub_key,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }
+    logger.debug("From Radio: %s", line)
 
     # Handle RAW messages
     if "U RAW:" in line:
@@ -48,17 +68,24 @@ def parse_and_publish(state: BridgeState, line: str) -> None:
     # Handle DEBUG messages
     if state.debug:
         if line.startswith("DEBUG"):
-            message.update({
+            message: dict = {
+                "timestamp": datetime.now(timezone.utc).isoformat(),
                 "type": "DEBUG",
                 "message": line
-            })
-            safe_publish(state, "debug", json.dumps(message))
+            }
+            safe_publish(state, "debug", encode_message(state, message))
             return
 
     # Handle Packet messages (RX and TX)
+    if PACKET_MARKER not in line:
+        return
+
     packet_match = PACKET_PATTERN.match(line)
     if packet_match:
-        direction = packet_match.group(3).lower()
+        # One groups() call instead of a group() lookup per field
+        (pkt_time, pkt_date, direction, length, packet_type, route, payload_len,
+         snr, rssi, score, duration, pkt_hash, path) = packet_match.groups()
+        direction = direction.lower()
 
         if direction == "rx":
             state.stats['packets_rx'] += 1
@@ -66,28 +93,26 @@ def parse_and_publish(state: BridgeState, line: str) -> None:
             state.stats['packets_tx'] += 1
 
         payload: dict = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "type": "PACKET",
             "direction": direction,
-            "time": packet_match.group(1),
-            "date": packet_match.group(2),
-            "len": packet_match.group(4),
-            "packet_type": packet_match.group(5),
-            "route": packet_match.group(6),
-            "payload_len": packet_match.group(7),
+            "time": pkt_time,
+            "date": pkt_date,
+            "len": length,
+            "packet_type": packet_type,
+            "route": route,
+            "payload_len": payload_len,
             "raw": state.last_raw
         }
 
         if direction == "rx":
-            payload.update({
-                "SNR": packet_match.group(8),
-                "RSSI": packet_match.group(9),
-                "score": packet_match.group(10),
-                "duration": packet_match.group(11),
-                "hash": packet_match.group(12)
-            })
-
-            if packet_match.group(6) == "D" and packet_match.group(13):
-                payload["path"] = packet_match.group(13)
-
-        message.update(payload)
-        safe_publish(state, "packets", json.dumps(message))
+            payload["SNR"] = snr
+            payload["RSSI"] = rssi
+            payload["score"] = score
+            payload["duration"] = duration
+            payload["hash"] = pkt_hash
+
+            if route == "D" and path:
+                payload["path"] = path
+
+        safe_publish(state, "packets", encode_message(state, payload))
@@ -20,12 +20,17 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Size of the precomputed reconnect jitter table (power of two)
+JITTER_TABLE_SIZE = 256
+
 
 class MqttManager:
     """Orchestrates multiple MQTT broker connections."""
 
     def __init__(self, state: BridgeState) -> None:
         self.state = state
+        self._jitter_table = [random.uniform(-0.5, 0.5) for _ in range(JITTER_TABLE_SIZE)]
+        self._jitter_idx = 0
 
     # ------------------------------------------------------------------
     # Connection lifecycle
@@ -48,9 +53,10 @@ class MqttManager:
                 use_tls = tls_cfg.get('enabled', False)
                 auth = broker.get('auth', {})
                 auth_method = auth.get('method', 'none')
-                logger.debug(f"  [{name}] ENABLED - {server}:{port} (transport={transport}, tls={use_tls}, auth={auth_method})")
+                logger.debug("  [%s] ENABLED - %s:%s (transport=%s, tls=%s, auth=%s)",
+                             name, server, port, transport, use_tls, auth_method)
             else:
-                logger.debug(f"  [{name}] DISABLED")
+                logger.debug("  [%s] DISABLED", name)
         logger.debug("=================================")
 
         for i, broker in enumerate(brokers):
@@ -82,9 +88,14 @@ class MqttManager:
         return True
 
     def reconnect_disconnected_brokers(self) -> None:
-        """Check for disconnected brokers and recreate them."""
+        """Check for disconnected brokers and recreate them.
+
+        Reconnect bookkeeping (connecting_since, connect_time, reconnect_at)
+        uses time.monotonic() so a clock step during time sync cannot stall
+        or rush reconnects.
+        """
         state = self.state
-        current_time = time.time()
+        current_time = time.monotonic()
 
         for i, mqtt_info in enumerate(state.mqtt_clients):
             if mqtt_info.get('connected', False):
@@ -117,7 +128,7 @@ class MqttManager:
                     old_client.loop_stop()
                     old_client.disconnect()
                 except Exception as e:
-                    logger.debug(f"[{broker_name}] Error stopping old client: {e}")
+                    logger.debug("[%s] Error stopping old client: %s", broker_name, e)
 
             # Clear token cache to force fresh token
             if broker_idx in state.token_cache:
@@ -129,11 +140,11 @@ class MqttManager:
             if new_client_info:
                 state.mqtt_clients[i] = new_client_info
                 new_client_info['client'].loop_start()
-                logger.debug(f"[{broker_name}] Recreated client successfully")
+                logger.debug("[%s] Recreated client successfully", broker_name)
             else:
                 mqtt_info['failed_attempts'] = failed_attempts + 1
-                jitter = random.uniform(-0.5, 0.5)
-                mqtt_info['reconnect_at'] = time.time() + max(0, mqtt_info['reconnect_delay'] + jitter)
+                jitter = self._next_jitter()
+                mqtt_info['reconnect_at'] = time.monotonic() + max(0, mqtt_info['reconnect_delay'] + jitter)
                 logger.warning(f"[{broker_name}] Failed to recreate client (attempt #{failed_attempts + 1}/{state.max_reconnect_attempts})")
 
             mqtt_info['reconnect_delay'] = min(
@@ -141,6 +152,40 @@ class MqttManager:
                 state.max_reconnect_delay
             )
 
+    def _mark_connected(self, mqtt_info: dict[str, Any]) -> bool:
+        """Flag a broker connected; returns whether it already was.
+
+        mqtt_connected_count only moves on a real False->True transition,
+        and the flag and count change together under mqtt_state_lock since
+        each broker's callbacks run on its own paho loop thread.
+        """
+        state = self.state
+        with state.mqtt_state_lock:
+            was_connected = mqtt_info.get('connected', False)
+            mqtt_info['connected'] = True
+            if not was_connected:
+                state.mqtt_connected_count += 1
+            state.mqtt_connected = True
+        return was_connected
+
+    def _mark_disconnected(self, mqtt_info: dict[str, Any]) -> bool:
+        """Flag a broker disconnected; returns whether it was connected."""
+        state = self.state
+        with state.mqtt_state_lock:
+            was_connected = mqtt_info.get('connected', False)
+            mqtt_info['connected'] = False
+            if was_connected:
+                state.mqtt_connected_count -= 1
+            if state.mqtt_connected_count == 0:
+                state.mqtt_connected = False
+        return was_connected
+
+    def _next_jitter(self) -> float:
+        """Next reconnect jitter in [-0.5, 0.5] from the precomputed table."""
+        jitter = self._jitter_table[self._jitter_idx & (JITTER_TABLE_SIZE - 1)]
+        self._jitter_idx += 1
+        return jitter
+
     def stop_websocket_ping_thread(self, broker_idx: int) -> None:
         """Cleanly stop the WebSocket ping thread for a broker."""
         state = self.state
@@ -149,7 +194,7 @@ class MqttManager:
             time.sleep(0.1)
             del state.ws_ping_threads[broker_idx]
             broker = topics.get_broker_config(state, broker_idx)
-            logger.debug(f"[{broker.get('name', broker_idx)}] Stopped WebSocket ping thread")
+            logger.debug("[%s] Stopped WebSocket ping thread", broker.get('name', broker_idx))
 
     # ------------------------------------------------------------------
     # MQTT callbacks
@@ -171,11 +216,10 @@ class MqttManager:
                 logger.error(f"[{broker_name}] on_connect fired but broker not in mqtt_clients list")
                 return
 
-            current_time = time.time()
-            was_connected = mqtt_info.get('connected', False)
+            current_time = time.monotonic()
             is_first_connect = mqtt_info.get('connect_time', 0) == 0
 
-            mqtt_info['connected'] = True
+            was_connected = self._mark_connected(mqtt_info)
             mqtt_info['connecting_since'] = 0
             mqtt_info['connect_time'] = current_time
             mqtt_info['reconnect_delay'] = 1.0
@@ -185,10 +229,7 @@ class MqttManager:
             elif is_first_connect:
                 logger.info(f"[{broker_name}] Connected to broker")
             else:
-                logger.debug(f"[{broker_name}] Connection state updated")
-
-            if not state.mqtt_connected:
-                state.mqtt_connected = True
+                logger.debug("[%s] Connection state updated", broker_name)
 
             # Publish online status
             status_topic = topics.get_topic(state, "status", broker_idx)
@@ -221,9 +262,9 @@ class MqttManager:
         if state.should_exit:
             for info in state.mqtt_clients:
                 if info['broker_idx'] == broker_idx:
-                    info['connected'] = False
+                    self._mark_disconnected(info)
                     break
-            logger.debug(f"[{broker_name}] Disconnected (shutdown)")
+            logger.debug("[%s] Disconnected (shutdown)", broker_name)
             return
 
         if broker_idx in state.ws_ping_threads:
@@ -234,18 +275,17 @@ class MqttManager:
         for info in state.mqtt_clients:
             if info['broker_idx'] == broker_idx:
                 mqtt_info = info
-                already_disconnected = not info.get('connected', False)
-                info['connected'] = False
+                already_disconnected = not self._mark_disconnected(info)
                 info['connecting_since'] = 0
-                info['reconnect_at'] = time.time() + info.get('reconnect_delay', 1.0)
+                info['reconnect_at'] = time.monotonic() + info.get('reconnect_delay', 1.0)
 
                 connect_time = info.get('connect_time', 0)
-                if connect_time > 0 and (time.time() - connect_time) < 120:
+                if connect_time > 0 and (time.monotonic() - connect_time) < 120:
                     info['failed_attempts'] = info.get('failed_attempts', 0) + 1
                     logger.warning(f"[{broker_name}] Short-lived connection detected (failed_attempts: {info['failed_attempts']})")
                 elif connect_time > 0:
                     if info.get('failed_attempts', 0) > 0:
-                        logger.info(f"[{broker_name}] Stable connection ended after {int(time.time() - connect_time)}s - resetting failure counter")
+                        logger.info(f"[{broker_name}] Stable connection ended after {int(time.monotonic() - connect_time)}s - resetting failure counter")
                         info['failed_attempts'] = 0
 
                 break
@@ -261,10 +301,6 @@ class MqttManager:
                     state.stats['reconnects'][broker_idx] = []
                 state.stats['reconnects'][broker_idx].append(current_time)
 
-        all_disconnected = all(not info.get('connected', False) for info in state.mqtt_clients)
-        if all_disconnected:
-            state.mqtt_connected = False
-
     def on_mqtt_message(self, client: Any, userdata: dict[str, Any] | None, msg: Any) -> None:
         """Handle incoming MQTT messages (for remote serial commands)."""
         state = self.state
@@ -276,7 +312,7 @@ class MqttManager:
 
         broker = topics.get_broker_config(state, broker_idx) if broker_idx is not None else {}
         broker_name = broker.get('name', f'broker-{broker_idx}')
-        logger.debug(f"[{broker_name}] Received message on {topic}")
+        logger.debug("[%s] Received message on %s", broker_name, topic)
 
         try:
             jwt_token = msg.payload.decode('utf-8').strip()
@@ -305,7 +341,7 @@ class MqttManager:
                 cached_token, created_at = state.token_cache[broker_idx]
                 age = current_time - created_at
                 if age < (state.token_ttl - 300):
-                    logger.debug(f"[{broker.get('name', broker_idx)}] Using cached auth token (age: {age:.0f}s)")
+                    logger.debug("[%s] Using cached auth token (age: %.0fs)", broker.get('name', broker_idx), age)
                     username = f"v1_{state.repeater_pub_key.upper()}"
                     return username, cached_token
 
@@ -332,13 +368,13 @@ class MqttManager:
                         claims['email'] = email.lower()
                 else:
                     if owner or email:
-                        logger.debug(f"[{broker.get('name', broker_idx)}] Skipping email/owner in JWT - TLS and TLS verify must both be enabled")
+                        logger.debug("[%s] Skipping email/owner in JWT - TLS and TLS verify must both be enabled", broker.get('name', broker_idx))
 
                 claims['client'] = state.client_version
 
                 password = state.auth.create_token(state.repeater_pub_key, state.repeater_priv_key, expiry_seconds=state.token_ttl, **claims)
                 state.token_cache[broker_idx] = (password, current_time)
-                logger.debug(f"[{broker.get('name', broker_idx)}] Generated fresh auth token (1h expiry)")
+                logger.debug("[%s] Generated fresh auth token (1h expiry)", broker.get('name', broker_idx))
                 return username, password
             except Exception as e:
                 logger.error(f"[{broker.get('name', broker_idx)}] Failed to generate auth token: {e}")
@@ -415,7 +451,7 @@ class MqttManager:
         broker_name = broker.get('name', f'broker-{broker_idx}')
 
         if not broker.get('enabled', False):
-            logger.debug(f"[{broker_name}] Disabled, skipping")
+            logger.debug("[%s] Disabled, skipping", broker_name)
             return None
 
         server = broker.get('server', '')
@@ -429,7 +465,7 @@ class MqttManager:
         tls_cfg = broker.get('tls', {})
         use_tls = tls_cfg.get('enabled', False)
 
-        logger.debug(f"[{broker_name}] Creating fresh client")
+        logger.debug("[%s] Creating fresh client", broker_name)
 
         broker_client = self._create_broker_client(broker_idx)
         if not broker_client:
@@ -461,7 +497,7 @@ class MqttManager:
                 'server': server,
                 'port': port,
                 'connected': False,
-                'connecting_since': time.time(),
+                'connecting_since': time.monotonic(),
                 'connect_time': 0,
                 'reconnect_at': 0,
                 'reconnect_delay': 1.0,
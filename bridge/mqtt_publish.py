@@ -14,6 +14,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# High-rate per-line topics; always published fire-and-forget at QoS 0
+TELEMETRY_TOPIC_TYPES = frozenset({"packets", "debug"})
+
 
 def safe_publish(
     state: BridgeState,
@@ -47,16 +50,19 @@ def safe_publish(
 
         try:
             broker_client = mqtt_client_info['client']
-            qos = broker.get('qos', 0)
-            if qos == 1:
-                qos = 0  # force qos=1 to 0 because qos 1 can cause retry storms
+            if topic_type in TELEMETRY_TOPIC_TYPES:
+                qos = 0
+            else:
+                qos = broker.get('qos', 0)
+                if qos == 1:
+                    qos = 0  # force qos=1 to 0 because qos 1 can cause retry storms
 
             result = broker_client.publish(topic, payload, qos=qos, retain=retain)
             if not result:
                 logger.error(f"[{broker_name}] Publish failed to {topic}")
                 state.stats['publish_failures'] += 1
             else:
-                logger.debug(f"[{broker_name}] Published to {topic}")
+                logger.debug("[%s] Published to %s", broker_name, topic)
                 success = True
         except Exception as e:
             logger.error(f"[{broker_name}] Publish error to {topic}: {str(e)}")
@@ -98,4 +104,4 @@ def publish_status(
     else:
         safe_publish(state, "status", json.dumps(status_msg), retain=False)
 
-    logger.debug(f"Published status: {status}")
+    logger.debug("Published status: %s", status)
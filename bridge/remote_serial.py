@@ -27,16 +27,25 @@ def is_command_allowed(state: BridgeState, command: str) -> tuple[bool, str | No
 
 
 def cleanup_old_nonces(state: BridgeState) -> None:
-    """Remove expired nonces from the tracking dict."""
-    current_time = int(time.time())
-    cutoff_time = current_time - state.remote_serial_nonce_ttl
-
-    expired = [nonce for nonce, ts in state.remote_serial_nonces.items() if ts < cutoff_time]
+    """Remove expired nonces from the tracking dict.
+
+    Nonces are recorded in arrival order, so the dict is oldest-first and
+    the sweep stops at the first fresh entry instead of scanning them all.
+    After a backwards clock step a few expired nonces may linger until the
+    entries ahead of them expire, which only extends replay protection.
+    """
+    cutoff_time = int(time.time()) - state.remote_serial_nonce_ttl
+
+    expired = []
+    for nonce, ts in state.remote_serial_nonces.items():
+        if ts >= cutoff_time:
+            break
+        expired.append(nonce)
     for nonce in expired:
         del state.remote_serial_nonces[nonce]
 
     if expired:
-        logger.debug(f"[SERIAL] Cleaned up {len(expired)} expired nonces")
+        logger.debug("[SERIAL] Cleaned up %d expired nonces", len(expired))
 
 
 def subscribe_serial_commands(state: BridgeState, client: BrokerClient, broker_idx: int) -> None:
@@ -95,7 +104,7 @@ def handle_serial_command(state: BridgeState, jwt_token: str, broker_idx: int) -
 
     # Verify target matches our public key
     if target != state.repeater_pub_key:
-        logger.debug(f"[SERIAL] Command target {target[:8]}... doesn't match our key {state.repeater_pub_key[:8]}...")
+        logger.debug("[SERIAL] Command target %s... doesn't match our key %s...", target[:8], state.repeater_pub_key[:8])
         return
 
     # Verify companion is in allowlist
@@ -120,7 +129,7 @@ def handle_serial_command(state: BridgeState, jwt_token: str, broker_idx: int) -
     # Verify JWT signature
     try:
         state.auth.verify_token(jwt_token, companion_pubkey)
-        logger.debug(f"[SERIAL] JWT signature verified for companion {companion_pubkey[:16]}...")
+        logger.debug("[SERIAL] JWT signature verified for companion %s...", companion_pubkey[:16])
     except Exception as e:
         logger.warning(f"[SERIAL] JWT signature verification failed: {e}")
         publish_serial_response(state, command, nonce, False, "Invalid signature", broker_idx)
@@ -191,7 +200,7 @@ def publish_serial_response(
                     result = mqtt_info['client'].publish(response_topic, response_jwt, qos=1)
                     if result:
                         published = True
-                        logger.debug(f"[{broker_name}] Published serial response to {response_topic}")
+                        logger.debug("[%s] Published serial response to %s", broker_name, response_topic)
                 except Exception as e:
                     broker = topics.get_broker_config(state, mqtt_info['broker_idx'])
                     broker_name = broker.get('name', f"broker-{mqtt_info['broker_idx']}")
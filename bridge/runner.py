@@ -4,6 +4,9 @@ from __future__ import annotations
 import json
 import logging
 import os
+import queue
+import select
+import signal
 import subprocess
 import threading
 import time
@@ -13,7 +16,6 @@ from typing import Any, TYPE_CHECKING
 from config_loader import log_config_sources
 
 from . import serial_connection
-from . import message_parser
 from . import background
 from .auth_provider import MeshCoreAuthProvider
 from .mqtt_publish import publish_status
@@ -23,6 +25,22 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Created by systemd-timesyncd once the system clock has been synchronized
+TIMESYNC_SYNCHRONIZED_FLAG = "/run/systemd/timesync/synchronized"
+
+
+def enqueue_line(state: BridgeState, line: str) -> None:
+    """Hand a serial line to the publisher thread, dropping the oldest if full."""
+    try:
+        state.line_queue.put_nowait(line)
+    except queue.Full:
+        try:
+            state.line_queue.get_nowait()
+        except queue.Empty:
+            pass
+        state.stats['lines_dropped'] += 1
+        state.line_queue.put_nowait(line)
+
 
 def load_client_version(version: str) -> str:
     """Load client version from provided version string, optionally append git hash."""
@@ -37,7 +55,7 @@ def load_client_version(version: str) -> str:
                 if git_hash and git_hash != 'unknown':
                     return f"meshcoretomqtt/{version}-{git_hash}"
     except Exception as e:
-        logger.debug(f"Could not load version info: {e}")
+        logger.debug("Could not load version info: %s", e)
     return f"meshcoretomqtt/{version}"
 
 
@@ -47,10 +65,73 @@ def handle_signal(state: BridgeState, signum: int, frame: Any) -> None:
     state.should_exit = True
 
 
-def wait_for_system_time_sync(state: BridgeState) -> bool:
-    """Wait up to 60 seconds for system clock synchronization via timedatectl."""
+def install_wakeup_fd(state: BridgeState) -> None:
+    """Make signal delivery wake the main loop's select() immediately.
+
+    The C-level signal handler writes to the pipe registered with
+    ``signal.set_wakeup_fd()``; the main loop waits on its read end next to
+    the serial port. Must be called from the main thread.
+    """
+    if state.wakeup_pipe is not None:
+        return
+    try:
+        read_fd, write_fd = os.pipe()
+    except OSError as e:
+        logger.debug("Signal wakeup pipe unavailable: %s", e)
+        return
+    try:
+        os.set_blocking(read_fd, False)
+        os.set_blocking(write_fd, False)
+        signal.set_wakeup_fd(write_fd)
+    except (OSError, ValueError) as e:
+        logger.debug("Signal wakeup pipe unavailable: %s", e)
+        os.close(read_fd)
+        os.close(write_fd)
+        return
+    state.wakeup_pipe = (read_fd, write_fd)
+
+
+def remove_wakeup_fd(state: BridgeState) -> None:
+    """Undo install_wakeup_fd() and close the pipe."""
+    if state.wakeup_pipe is None:
+        return
+    try:
+        signal.set_wakeup_fd(-1)
+    except ValueError:
+        pass
+    for fd in state.wakeup_pipe:
+        os.close(fd)
+    state.wakeup_pipe = None
+
+
+def _idle_wait(state: BridgeState, timeout: float) -> None:
+    """Sleep up to ``timeout`` seconds, returning early if a signal arrives."""
+    if state.wakeup_pipe is None:
+        sleep(timeout)
+        return
+    read_fd = state.wakeup_pipe[0]
+    ready, _, _ = select.select([read_fd], [], [], timeout)
+    if ready:
+        serial_connection.drain_wakeup_fd(read_fd)
+
+
+def wait_for_system_time_sync(
+    state: BridgeState,
+    sync_flag: str = TIMESYNC_SYNCHRONIZED_FLAG,
+    max_attempts: int = 30,
+    retry_interval: float = 2.0,
+) -> bool:
+    """Wait up to ~60 seconds for system clock synchronization.
+
+    systemd-timesyncd touches ``sync_flag`` once the clock is synchronized, so
+    a single stat() answers the common case without spawning a process.
+    Otherwise fall back to polling ``timedatectl``.
+    """
     attempts = 0
-    while attempts < 60 and not state.should_exit:
+    while attempts < max_attempts and not state.should_exit:
+        if os.path.exists(sync_flag):
+            return True
+
         try:
             result = subprocess.run(
                 ['timedatectl', 'status'],
@@ -70,7 +151,7 @@ def wait_for_system_time_sync(state: BridgeState) -> bool:
         logger.warning("System clock is not synchronized: %s",
                        result.stderr.strip() or result.stdout.strip())
         attempts += 1
-        time.sleep(1)
+        time.sleep(retry_interval)
 
     logger.warning("Timed out waiting for system clock sync — continuing anyway.")
     return True
@@ -137,7 +218,7 @@ def run(state: BridgeState) -> None:
         if state.remote_serial_allowed_companions:
             logger.info(f"Remote serial: ENABLED ({len(state.remote_serial_allowed_companions)} companion(s) allowed)")
             for pubkey in sorted(state.remote_serial_allowed_companions):
-                logger.debug(f"  Allowed companion: {pubkey[:16]}...")
+                logger.debug("  Allowed companion: %s...", pubkey[:16])
         else:
             logger.warning("Remote serial: ENABLED but no companions configured (will reject all commands)")
         if state.remote_serial_disallowed_commands:
@@ -172,12 +253,26 @@ def run(state: BridgeState) -> None:
     stats_thread.start()
     logger.debug("[STATS] Started statistics logging thread")
 
+    # Parse and publish on a separate thread so broker latency never
+    # back-pressures serial reads
+    publisher_thread = threading.Thread(
+        target=background.publisher_loop,
+        args=(state,),
+        daemon=True,
+        name="Line-Publisher"
+    )
+    publisher_thread.start()
+
     # Serial watchdog: force reconnect if no data received for this many seconds
     serial_cfg = state.config.get('serial', {})
     watchdog_timeout = serial_cfg.get('watchdog_timeout', 900)
     watchdog_logged = False
+    absent_logged = False  # "device not present" warning already emitted
     last_reconnect_attempt = 0.0
     reconnect_interval = 5  # seconds between retry attempts
+    read_wait_timeout = 0.5  # max seconds to block waiting for serial data
+    install_wakeup_fd(state)
+    wake_fd = state.wakeup_pipe[0] if state.wakeup_pipe else None
 
     # Main event loop
     try:
@@ -187,12 +282,12 @@ def run(state: BridgeState) -> None:
 
             state.mqtt_manager.reconnect_disconnected_brokers()
 
+            line = None
             try:
                 if state.device:
                     line = state.device.read_line()
                     if line:
-                        logger.debug(f"RX: {line}")
-                        message_parser.parse_and_publish(state, line)
+                        enqueue_line(state, line)
                         watchdog_logged = False
 
                     # Watchdog: detect silently dead serial connections
@@ -212,9 +307,17 @@ def run(state: BridgeState) -> None:
                             watchdog_logged = True
                         sleep(0.5)
                 else:
-                    # Device is None — periodically retry connection
-                    now = time.time()
-                    if now - last_reconnect_attempt >= reconnect_interval:
+                    # Device is None — retry once a configured port exists again.
+                    # The existence check is a stat() per tick; a port that has
+                    # just reappeared is tried right away, so a replugged device
+                    # is picked up within read_wait_timeout.
+                    now = time.monotonic()
+                    if not serial_connection.ports_present(state.config):
+                        if not absent_logged:
+                            logger.warning("Serial device not present, waiting for it to reappear")
+                            absent_logged = True
+                    elif absent_logged or now - last_reconnect_attempt >= reconnect_interval:
+                        absent_logged = False
                         last_reconnect_attempt = now
                         state.device = serial_connection.connect(state.config)
                         if state.device:
@@ -225,6 +328,13 @@ def run(state: BridgeState) -> None:
                                 logger.warning("Serial device unavailable, retrying every %ds", reconnect_interval)
                                 watchdog_logged = True
 
+                # Block until the device has data instead of busy-polling; the
+                # timeout keeps shutdown and broker reconnects responsive.
+                if state.device and not line:
+                    state.device.wait_for_data(read_wait_timeout, wake_fd)
+                elif not state.device:
+                    _idle_wait(state, read_wait_timeout)
+
             except OSError:
                 logger.warning("Serial connection unavailable, trying to reconnect")
                 if state.device:
@@ -232,17 +342,16 @@ def run(state: BridgeState) -> None:
                 state.device = serial_connection.connect(state.config)
                 sleep(0.5)
 
-            sleep(0.01)
-
     except KeyboardInterrupt:
         logger.info("\nExiting...")
     except Exception as e:
         logger.exception(f"Unhandled error in main loop: {e}")
     finally:
-        _cleanup(state, stats_thread)
+        _cleanup(state, stats_thread, publisher_thread)
 
 
-def _cleanup(state: BridgeState, stats_thread: threading.Thread) -> None:
+def _cleanup(state: BridgeState, stats_thread: threading.Thread,
+             publisher_thread: threading.Thread) -> None:
     """Shut down background threads, publish offline status, and close connections."""
     logger.info("Cleaning up...")
     state.should_exit = True
@@ -254,6 +363,10 @@ def _cleanup(state: BridgeState, stats_thread: threading.Thread) -> None:
             if broker_idx is not None:
                 state.mqtt_manager.stop_websocket_ping_thread(broker_idx)
 
+    # Let the publisher flush lines already read from serial
+    if publisher_thread.is_alive():
+        publisher_thread.join(timeout=2)
+
     # Wait for stats thread to finish
     if stats_thread.is_alive():
         stats_thread.join(timeout=5)
@@ -279,3 +392,5 @@ def _cleanup(state: BridgeState, stats_thread: threading.Thread) -> None:
     # Close serial connection
     if state.device:
         state.device.close()
+
+    remove_wakeup_fd(state)
@@ -4,6 +4,8 @@ from __future__ import annotations
 import calendar
 import json
 import logging
+import os
+import selectors
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -14,6 +16,10 @@ import serial
 
 logger = logging.getLogger(__name__)
 
+# Longest partial line kept while waiting for its newline; anything longer is
+# handed on as-is so a device streaming without newlines cannot grow the buffer
+MAX_LINE_LENGTH = 4096
+
 
 class SerialConnection(ABC):
     """Abstract interface for MeshCore device communication.
@@ -54,6 +60,15 @@ class SerialConnection(ABC):
         """Non-blocking read of next available line, or None if nothing waiting."""
         ...
 
+    @abstractmethod
+    def wait_for_data(self, timeout: float, wake_fd: int | None = None) -> bool:
+        """Block until data may be available to read or timeout elapses.
+
+        If ``wake_fd`` becomes readable first it is drained and False is
+        returned, letting the caller react to signals immediately.
+        """
+        ...
+
     @abstractmethod
     def seconds_since_activity(self) -> float:
         """Seconds since data was last received from the device."""
@@ -74,6 +89,10 @@ class RealSerialConnection(SerialConnection):
         self._port = port
         self._lock = threading.Lock()
         self._last_activity = time.time()
+        self._selector: selectors.BaseSelector | None = None
+        self._wake_fd: int | None = None
+        # Bytes read from the port that do not yet form a complete line
+        self._rx_buf = bytearray()
 
     def _send(self, cmd: str, delay: float = 0.5) -> str:
         """Send command and read response under lock."""
@@ -84,6 +103,7 @@ class RealSerialConnection(SerialConnection):
         """Send command and read response (caller must hold lock)."""
         self._port.reset_input_buffer()
         self._port.reset_output_buffer()
+        self._rx_buf.clear()
         self._port.write(cmd.encode())
         sleep(delay)
         return self._port.read_all().decode(errors='replace')
@@ -92,11 +112,11 @@ class RealSerialConnection(SerialConnection):
         epoch_time = int(calendar.timegm(time.gmtime()))
         cmd = f'time {epoch_time}\r\n'
         response = self._send(cmd)
-        logger.debug(f"Set time response: {response}")
+        logger.debug("Set time response: %s", response)
 
     def get_name(self) -> str | None:
         response = self._send("get name\r\n")
-        logger.debug(f"Raw response: {response}")
+        logger.debug("Raw response: %s", response)
 
         if "-> >" in response:
             name = response.split("-> >")[1].strip()
@@ -111,7 +131,7 @@ class RealSerialConnection(SerialConnection):
 
     def get_pubkey(self) -> str | None:
         response = self._send("get public.key\r\n", delay=1.0)
-        logger.debug(f"Raw response: {response}")
+        logger.debug("Raw response: %s", response)
 
         if "-> >" in response:
             pub_key = response.split("-> >")[1].strip()
@@ -154,13 +174,13 @@ class RealSerialConnection(SerialConnection):
 
     def get_radio_info(self) -> str | None:
         response = self._send("get radio\r\n")
-        logger.debug(f"Raw radio response: {response}")
+        logger.debug("Raw radio response: %s", response)
 
         if "-> >" in response:
             radio_info = response.split("-> >")[1].strip()
             if '\n' in radio_info:
                 radio_info = radio_info.split('\n')[0]
-            logger.debug(f"Parsed radio info: {radio_info}")
+            logger.debug("Parsed radio info: %s", radio_info)
             return radio_info
 
         logger.error("Failed to get radio info from response")
@@ -168,7 +188,7 @@ class RealSerialConnection(SerialConnection):
 
     def get_firmware_version(self) -> str | None:
         response = self._send("ver\r\n")
-        logger.debug(f"Raw version response: {response}")
+        logger.debug("Raw version response: %s", response)
 
         if "-> " in response:
             version = response.split("-> ", 1)[1]
@@ -181,7 +201,7 @@ class RealSerialConnection(SerialConnection):
 
     def get_board_type(self) -> str | None:
         response = self._send("board\r\n")
-        logger.debug(f"Raw board response: {response}")
+        logger.debug("Raw board response: %s", response)
 
         if "-> " in response:
             board_type = response.split("-> ", 1)[1]
@@ -200,7 +220,7 @@ class RealSerialConnection(SerialConnection):
         with self._lock:
             # stats-core: battery_mv, uptime_secs, errors, queue_len
             response = self._send_unlocked("stats-core\r\n")
-            logger.debug(f"Raw stats-core response: {response}")
+            logger.debug("Raw stats-core response: %s", response)
 
             if "-> " in response and "Unknown command" not in response:
                 try:
@@ -216,11 +236,11 @@ class RealSerialConnection(SerialConnection):
                     if 'queue_len' in core_stats:
                         stats['queue_len'] = core_stats['queue_len']
                 except (json.JSONDecodeError, ValueError) as e:
-                    logger.debug(f"Failed to parse stats-core: {e}")
+                    logger.debug("Failed to parse stats-core: %s", e)
 
             # stats-radio: noise_floor, tx_air_secs, rx_air_secs
             response = self._send_unlocked("stats-radio\r\n")
-            logger.debug(f"Raw stats-radio response: {response}")
+            logger.debug("Raw stats-radio response: %s", response)
 
             if "-> " in response and "Unknown command" not in response:
                 try:
@@ -234,11 +254,11 @@ class RealSerialConnection(SerialConnection):
                     if 'rx_air_secs' in radio_stats:
                         stats['rx_air_secs'] = radio_stats['rx_air_secs']
                 except (json.JSONDecodeError, ValueError) as e:
-                    logger.debug(f"Failed to parse stats-radio: {e}")
+                    logger.debug("Failed to parse stats-radio: %s", e)
 
             # stats-packets: recv_errors
             response = self._send_unlocked("stats-packets\r\n")
-            logger.debug(f"Raw stats-packets response: {response}")
+            logger.debug("Raw stats-packets response: %s", response)
 
             if "-> " in response and "Unknown command" not in response:
                 try:
@@ -248,7 +268,7 @@ class RealSerialConnection(SerialConnection):
                     if 'recv_errors' in packets_stats:
                         stats['recv_errors'] = packets_stats['recv_errors']
                 except (json.JSONDecodeError, ValueError) as e:
-                    logger.debug(f"Failed to parse stats-packets: {e}")
+                    logger.debug("Failed to parse stats-packets: %s", e)
 
         if stats:
             self._last_activity = time.time()
@@ -260,13 +280,14 @@ class RealSerialConnection(SerialConnection):
             with self._lock:
                 self._port.reset_input_buffer()
                 self._port.reset_output_buffer()
+                self._rx_buf.clear()
 
                 cmd_bytes = command.strip()
                 if not cmd_bytes.endswith('\r\n'):
                     cmd_bytes += '\r\n'
 
                 self._port.write(cmd_bytes.encode('utf-8'))
-                logger.debug(f"[SERIAL] Sent: {command.strip()}")
+                logger.debug("[SERIAL] Sent: %s", command.strip())
 
                 start_time = time.time()
                 response_lines: list[str] = []
@@ -301,7 +322,7 @@ class RealSerialConnection(SerialConnection):
                 if not response_text:
                     response_text = "(no output)"
 
-                logger.debug(f"[SERIAL] Response: {response_text[:100]}{'...' if len(response_text) > 100 else ''}")
+                logger.debug("[SERIAL] Response: %s%s", response_text[:100], '...' if len(response_text) > 100 else '')
                 return True, response_text
 
         except serial.SerialException as e:
@@ -312,18 +333,78 @@ class RealSerialConnection(SerialConnection):
             return False, f"Error: {str(e)}"
 
     def read_line(self) -> str | None:
+        # Idle check without the lock: in_waiting is a single ioctl and the
+        # buffer test is atomic, so only take the lock when there is data.
+        # The lock itself stays, since stats and remote serial commands
+        # share the port from other threads.
+        if b'\n' not in self._rx_buf and self._port.in_waiting <= 0:
+            return None
+
         with self._lock:
-            if self._port.in_waiting > 0:
-                line = self._port.readline().decode(errors='replace').strip()
+            if b'\n' not in self._rx_buf:
+                waiting = self._port.in_waiting
+                if waiting > 0:
+                    # Drain everything the driver has in one call and split
+                    # lines ourselves rather than byte-stepping readline()
+                    self._rx_buf += self._port.read(waiting)
+
+                if len(self._rx_buf) > MAX_LINE_LENGTH and b'\n' not in self._rx_buf:
+                    logger.warning("Serial line exceeded %d bytes without a newline, flushing it", MAX_LINE_LENGTH)
+                    line = self._rx_buf.decode(errors='replace').strip()
+                    self._rx_buf = bytearray()
+                    if line:
+                        self._last_activity = time.time()
+                        return line
+                    return None
+
+            while b'\n' in self._rx_buf:
+                raw, _, rest = self._rx_buf.partition(b'\n')
+                self._rx_buf = rest
+                line = raw.decode(errors='replace').strip()
                 if line:
                     self._last_activity = time.time()
                     return line
         return None
 
+    def wait_for_data(self, timeout: float, wake_fd: int | None = None) -> bool:
+        if b'\n' in self._rx_buf or self._port.in_waiting > 0:
+            return True
+
+        if self._selector is None:
+            try:
+                fd = self._port.fileno()
+            except (AttributeError, OSError, ValueError):
+                fd = None
+            if not isinstance(fd, int):
+                # No pollable descriptor (e.g. Windows) — fall back to a short sleep
+                sleep(min(timeout, 0.01))
+                return False
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(fd, selectors.EVENT_READ)
+
+        if wake_fd != self._wake_fd:
+            if self._wake_fd is not None:
+                self._selector.unregister(self._wake_fd)
+            if wake_fd is not None:
+                self._selector.register(wake_fd, selectors.EVENT_READ)
+            self._wake_fd = wake_fd
+
+        ready = False
+        for key, _ in self._selector.select(timeout):
+            if key.fd == wake_fd:
+                drain_wakeup_fd(key.fd)
+                return False
+            ready = True
+        return ready
+
     def seconds_since_activity(self) -> float:
         return time.time() - self._last_activity
 
     def close(self) -> None:
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+            self._wake_fd = None
         try:
             with self._lock:
                 if self._port and getattr(self._port, 'is_open', False):
@@ -337,6 +418,41 @@ class RealSerialConnection(SerialConnection):
         return getattr(self._port, 'is_open', False)
 
 
+def drain_wakeup_fd(fd: int) -> None:
+    """Discard pending bytes on a non-blocking signal wakeup pipe."""
+    try:
+        while os.read(fd, 512):
+            pass
+    except (BlockingIOError, InterruptedError):
+        pass
+
+
+def _enable_low_latency(ser: serial.Serial) -> None:
+    """Ask the Linux TTY driver to deliver bytes immediately (ASYNC_LOW_LATENCY).
+
+    Without this, USB serial drivers may batch incoming data on a timer,
+    adding latency to every line. Unsupported platforms/drivers are ignored.
+    """
+    set_low_latency = getattr(ser, 'set_low_latency_mode', None)
+    if set_low_latency is None:
+        return
+    try:
+        set_low_latency(True)
+        logger.debug("Enabled low-latency mode on %s", ser.port)
+    except (OSError, ValueError) as e:
+        logger.debug("Low-latency mode not supported on %s: %s", ser.port, e)
+
+
+def ports_present(config: dict[str, Any]) -> bool:
+    """Whether any configured serial port currently exists.
+
+    Ports that are not filesystem paths (e.g. ``COM3`` or pyserial URLs)
+    cannot be checked and are assumed present.
+    """
+    ports = config.get('serial', {}).get('ports', ['/dev/ttyACM0'])
+    return any(not port.startswith('/') or os.path.exists(port) for port in ports)
+
+
 def connect(config: dict[str, Any]) -> RealSerialConnection | None:
     """Try configured serial ports and return the first successful connection."""
     serial_cfg = config.get('serial', {})
@@ -355,6 +471,7 @@ def connect(config: dict[str, Any]) -> RealSerialConnection | None:
                 timeout=timeout,
                 rtscts=False
             )
+            _enable_low_latency(ser)
             ser.write(b"\r\n\r\n")
             ser.reset_input_buffer()
             ser.reset_output_buffer()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import queue
 import threading
 import time
 from typing import Any, TYPE_CHECKING
@@ -12,6 +13,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Serial lines buffered between the reader and the publisher thread; when
+# full the oldest line is dropped so published data stays current.
+LINE_QUEUE_SIZE = 1000
+
 
 def parse_allowed_companions(remote_cfg: dict[str, Any]) -> set[str]:
     """Parse allowed_companions from config into a set of public keys."""
@@ -57,11 +62,19 @@ class BridgeState:
         # MQTT state
         self.mqtt_clients: list[dict[str, Any]] = []
         self.mqtt_connected: bool = False
+        self.mqtt_connected_count: int = 0  # brokers currently marked connected
+        # Guards the per-broker 'connected' flags, mqtt_connected_count and
+        # mqtt_connected, which are updated from each broker's loop thread
+        self.mqtt_state_lock = threading.Lock()
         self.connection_events: dict[int, threading.Event] = {}
         self.mqtt_manager: Any = None  # Set by bridge.__init__
+        self.topic_cache: dict[tuple[str, int | None, str | None], str] = {}
+        self.origin_json_cache: dict[tuple[str | None, str | None], str] = {}
 
         # Lifecycle
         self.should_exit: bool = False
+        # (read_fd, write_fd) of the signal.set_wakeup_fd() pipe, if installed
+        self.wakeup_pipe: tuple[int, int] | None = None
 
         # Config-derived values
         self.global_iata: str = config.get('general', {}).get('iata', 'XXX')
@@ -100,6 +113,7 @@ class BridgeState:
             'packets_tx_prev': 0,
             'bytes_processed': 0,
             'publish_failures': 0,
+            'lines_dropped': 0,
             'last_stats_log': time.time(),
             'reconnects': {},
             'device': {},
@@ -108,5 +122,7 @@ class BridgeState:
 
         # Message parsing state
         self.last_raw: str | None = None
+        # Lines handed from the serial reader to the publisher thread
+        self.line_queue: queue.Queue[str] = queue.Queue(maxsize=LINE_QUEUE_SIZE)
 
         logger.info("Configuration loaded from TOML")
@@ -7,6 +7,8 @@ from typing import Any, TYPE_CHECKING
 if TYPE_CHECKING:
     from .state import BridgeState
 
+_CLIENT_ID_INVALID_RE = re.compile(r"[^a-zA-Z0-9_-]")
+
 
 def get_broker_config(state: BridgeState, broker_idx: int) -> dict[str, Any]:
     """Get broker config by index into the broker list."""
@@ -35,7 +37,22 @@ def resolve_topic_template(state: BridgeState, template: str, broker_idx: int |
 
 
 def get_topic(state: BridgeState, topic_type: str, broker_idx: int | None = None) -> str:
-    """Get topic with template resolution, checking broker-specific override first."""
+    """Get topic with template resolution, checking broker-specific override first.
+
+    Results are cached on the state; the public key is part of the cache key
+    so topics resolved before the device was queried are never reused.
+    """
+    cache_key = (topic_type, broker_idx, state.repeater_pub_key)
+    topic = state.topic_cache.get(cache_key)
+    if topic is not None:
+        return topic
+
+    topic = _build_topic(state, topic_type, broker_idx)
+    state.topic_cache[cache_key] = topic
+    return topic
+
+
+def _build_topic(state: BridgeState, topic_type: str, broker_idx: int | None) -> str:
     if broker_idx is not None:
         broker = get_broker_config(state, broker_idx)
         broker_topics = broker.get('topics', {})
@@ -51,5 +68,5 @@ def get_topic(state: BridgeState, topic_type: str, broker_idx: int | None = None
 def sanitize_client_id(name: str, prefix: str = "meshcore_") -> str:
     """Convert a name to a valid MQTT client ID."""
     client_id = prefix + name.replace(" ", "_")
-    client_id = re.sub(r"[^a-zA-Z0-9_-]", "", client_id)
+    client_id = _CLIENT_ID_INVALID_RE.sub("", client_id)
     return client_id[:23]
@@ -32,6 +32,13 @@ IATA_API_BASE = "https://api.letsmesh.net/api/iata"
 USER_CONFIG_FILENAME = "99-user.toml"
 LEGACY_USER_CONFIG_FILENAME = "00-user.toml"
 PRESET_PREFIX = "10-"
+# Normalized (uppercase) MeshCore public key
+_PUBKEY_RE = re.compile(r"[0-9A-F]{64}")
+# Matches the quoted iata value in [general]; group 2 is the value
+_IATA_LINE_RE = re.compile(r'^(\s*iata\s*=\s*")([^"]*)"', re.MULTILINE)
+# Airport names from successful code lookups, keyed on (code, script_version).
+# Misses and network failures are not cached so a retry still hits the API.
+_iata_name_cache: dict[tuple[str, str], str] = {}
 
 
 def user_config_path(config_dir: str | Path) -> Path:
@@ -71,7 +78,7 @@ def validate_meshcore_pubkey(key: str) -> str | None:
     key = key.replace(" ", "").upper()
     if len(key) != 64:
         return None
-    if not re.fullmatch(r"[0-9A-F]{64}", key):
+    if not _PUBKEY_RE.fullmatch(key):
         return None
     return key
 
@@ -702,13 +709,19 @@ def _lookup_iata_code_with_retry(
     attempts: int = 3,
 ) -> tuple[str | None, bool]:
     """Look up an IATA code. Returns (airport name, validation_unavailable)."""
+    cached = _iata_name_cache.get((code, script_version))
+    if cached is not None:
+        return cached, False
     url = _iata_api_url(f"code={urllib.request.quote(code)}", script_version)
     for attempt in range(1, attempts + 1):
         try:
             data = json.loads(_iata_request(url))
             if not isinstance(data, dict):
                 return None, False
-            return data.get("name"), False
+            name = data.get("name")
+            if name:
+                _iata_name_cache[(code, script_version)] = name
+            return name, False
         except (urllib.error.URLError, json.JSONDecodeError, KeyError, OSError):
             if attempt == attempts:
                 return None, True
@@ -1355,18 +1368,28 @@ def update_owner_info(config_dir: str) -> None:
 
 def _read_existing_iata(user_toml: str) -> str:
     """Read the existing IATA code from a user TOML."""
-    if not Path(user_toml).exists():
+    try:
+        content = Path(user_toml).read_text()
+    except FileNotFoundError:
         return ""
-    content = Path(user_toml).read_text()
-    match = re.search(r'^\s*iata\s*=\s*"([^"]*)"', content, re.MULTILINE)
-    return match.group(1) if match else ""
+    match = _IATA_LINE_RE.search(content)
+    return match.group(2) if match else ""
 
 
 def _update_iata_in_file(user_toml: str, iata: str) -> None:
-    """Update the iata value in a user TOML."""
-    content = Path(user_toml).read_text()
-    content = re.sub(r'^(iata\s*=\s*).*$', f'\\1"{iata}"', content, flags=re.MULTILINE)
-    Path(user_toml).write_text(content)
+    """Update the iata value in a user TOML.
+
+    Only the quoted value is replaced, so indentation and trailing comments
+    on the line are kept. Falls back to rewriting the whole line if the
+    existing value isn't a quoted string.
+    """
+    path = Path(user_toml)
+    original = path.read_text()
+    content, count = _IATA_LINE_RE.subn(lambda m: f'{m.group(1)}{iata}"', original, count=1)
+    if count == 0:
+        content = re.sub(r'^(iata\s*=\s*).*$', f'\\1"{iata}"', original, flags=re.MULTILINE)
+    if content != original:
+        path.write_text(content)
 
 
 # Need platform for the import in configure_mqtt_brokers
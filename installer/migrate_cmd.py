@@ -29,17 +29,20 @@ if TYPE_CHECKING:
 def parse_env_file(path: str) -> dict[str, str]:
     """Parse a .env file into a dict."""
     env: dict[str, str] = {}
-    if not path or not os.path.exists(path):
+    if not path:
+        return env
+    try:
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                key, sep, value = line.partition("=")
+                if not sep:
+                    continue
+                env[key.strip()] = value.strip()
+    except FileNotFoundError:
         return env
-    with open(path) as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-            if "=" not in line:
-                continue
-            key, _, value = line.partition("=")
-            env[key.strip()] = value.strip()
     return env
 
 
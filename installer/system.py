@@ -224,6 +224,10 @@ def chown_recursive(path: str, user: str, group: str) -> None:
 # File download
 # ---------------------------------------------------------------------------
 
+# Base for repo archive downloads; tests point this at a local HTTP server
+GITHUB_BASE_URL = "https://github.com"
+
+
 def download_file(url: str, dest: str, name: str) -> None:
     """Download a file with curl and retry."""
     print_info(f"Downloading {name}...")
@@ -249,7 +253,7 @@ def download_repo_archive(repo: str, branch: str, dest_dir: str) -> str:
     """
     # TODO: Switch to downloading GitHub Releases once CI/CD is set up
     # to create tagged releases. For now, download the branch archive.
-    archive_url = f"https://github.com/{repo}/archive/refs/heads/{branch}.zip"
+    archive_url = f"{GITHUB_BASE_URL}/{repo}/archive/refs/heads/{branch}.zip"
     zip_path = os.path.join(dest_dir, "repo.zip")
 
     print_info(f"Downloading repository archive ({repo} @ {branch})...")
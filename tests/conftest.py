@@ -17,12 +17,20 @@ def pytest_configure(config: pytest.Config) -> None:
     config.addinivalue_line(
         "markers", "e2e: needs real services/devices (MCTOMQTT_TEST_E2E=1)"
     )
+    # Registered here too so the mark is known when pytest-xdist isn't installed
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on one pytest-xdist worker"
+    )
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
     # network and system run by default; set SKIP vars to disable
     # e2e is opt-in; set MCTOMQTT_TEST_E2E=1 to enable
     for item in items:
+        # system/e2e tests share host resources (service users, systemd
+        # units, Docker containers); keep them on a single xdist worker
+        if "system" in item.keywords or "e2e" in item.keywords:
+            item.add_marker(pytest.mark.xdist_group("host"))
         if "network" in item.keywords and os.environ.get("MCTOMQTT_SKIP_NETWORK"):
             item.add_marker(
                 pytest.mark.skip(reason="MCTOMQTT_SKIP_NETWORK is set")
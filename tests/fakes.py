@@ -78,6 +78,9 @@ class FakeSerialConnection(SerialConnection):
             return self._lines.pop(0)
         return None
 
+    def wait_for_data(self, timeout: float, wake_fd: int | None = None) -> bool:
+        return bool(self._lines)
+
     def seconds_since_activity(self) -> float:
         return time.time() - self._last_activity
 
@@ -207,7 +210,8 @@ def make_test_state(
         state.auth = auth
     if broker_clients is not None:
         state.mqtt_clients = broker_clients
-        state.mqtt_connected = any(info.get('connected', False) for info in broker_clients)
+        state.mqtt_connected_count = sum(1 for info in broker_clients if info.get('connected', False))
+        state.mqtt_connected = state.mqtt_connected_count > 0
     for key, value in overrides.items():
         setattr(state, key, value)
     return state
@@ -0,0 +1,61 @@
+"""Tests for background thread loops."""
+from __future__ import annotations
+
+import json
+import threading
+
+from bridge.background import publisher_loop
+from tests.fakes import FakeBrokerClient, make_test_state
+
+
+class TestPublisherLoop:
+    def _make_state(self):
+        broker = FakeBrokerClient()
+        broker._connected = True
+        state = make_test_state(
+            broker_clients=[{"client": broker, "broker_idx": 0, "connected": True}],
+            repeater_name="TestNode",
+            repeater_pub_key="AA" * 32,
+        )
+        return state, broker
+
+    def test_drains_queue_before_exiting(self):
+        state, broker = self._make_state()
+        state.line_queue.put("12:34:56 - 1/15/2025 U: TX, len=32 (type=2, route=F, payload_len=16)")
+        state.line_queue.put("random garbage line")
+        state.should_exit = True
+
+        publisher_loop(state)
+
+        assert state.line_queue.empty()
+        assert len(broker.published) == 1
+        assert json.loads(broker.published[0][1])['direction'] == "tx"
+
+    def test_publishes_from_thread(self):
+        state, broker = self._make_state()
+        thread = threading.Thread(target=publisher_loop, args=(state,), daemon=True)
+        thread.start()
+
+        state.line_queue.put("12:34:56 - 1/15/2025 U: TX, len=32 (type=2, route=F, payload_len=16)")
+        state.should_exit = True
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert len(broker.published) == 1
+
+    def test_survives_parser_errors(self, monkeypatch):
+        state, broker = self._make_state()
+        calls = []
+
+        def failing_parse(_state, line):
+            calls.append(line)
+            raise ValueError("boom")
+
+        monkeypatch.setattr("bridge.message_parser.parse_and_publish", failing_parse)
+        state.line_queue.put("a")
+        state.line_queue.put("b")
+        state.should_exit = True
+
+        publisher_loop(state)
+
+        assert calls == ["a", "b"]
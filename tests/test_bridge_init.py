@@ -1,30 +1,33 @@
 """Tests for MeshCoreBridge facade."""
 from __future__ import annotations
 
+import pytest
+
 from bridge import MeshCoreBridge
 from bridge.state import BridgeState
 from bridge.mqtt_manager import MqttManager
 from tests.fakes import make_config
 
 
+@pytest.fixture(scope="class")
+def bridge() -> MeshCoreBridge:
+    """One bridge shared by the read-only facade tests."""
+    return MeshCoreBridge(make_config(), debug=True, version="1.0.8.0")
+
+
 class TestMeshCoreBridgeFacade:
-    def test_creates_state(self):
-        config = make_config()
-        bridge = MeshCoreBridge(config, debug=True, version="1.0.8.0")
+    def test_creates_state(self, bridge):
         assert isinstance(bridge.state, BridgeState)
         assert bridge.state.debug is True
 
-    def test_creates_mqtt_manager(self):
-        config = make_config()
-        bridge = MeshCoreBridge(config, version="1.0.8.0")
+    def test_creates_mqtt_manager(self, bridge):
         assert isinstance(bridge.state.mqtt_manager, MqttManager)
 
-    def test_client_version_set(self):
-        config = make_config()
-        bridge = MeshCoreBridge(config, version="1.0.8.0")
+    def test_client_version_set(self, bridge):
         assert bridge.state.client_version.startswith("meshcoretomqtt/1.0.8.0")
 
     def test_handle_signal_sets_exit(self):
+        # Mutates should_exit, so it gets its own bridge
         config = make_config()
         bridge = MeshCoreBridge(config, version="1.0.8.0")
         assert bridge.state.should_exit is False
@@ -38,13 +38,18 @@ from installer.config import (
     write_user_toml_base,
 )
 
+
+def _load_toml(path: str | Path) -> dict:
+    """Parse a written TOML file."""
+    return tomllib.loads(Path(path).read_text(encoding="utf-8"))
+
+
 class TestWriteUserTomlBase:
     def test_creates_file_with_sections(self, tmp_path: Path) -> None:
         dest = str(tmp_path / "00-user.toml")
         write_user_toml_base(dest, "SEA", "/dev/ttyACM0", "Cisien/meshcoretomqtt", "main")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["general"]["iata"] == "SEA"
         assert data["serial"]["ports"] == ["/dev/ttyACM0"]
@@ -55,8 +60,7 @@ class TestWriteUserTomlBase:
         dest = str(tmp_path / "00-user.toml")
         write_user_toml_base(dest, 'S"A', "/dev/t\\y", "repo", "branch")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["general"]["iata"] == 'S"A'
         assert data["serial"]["ports"] == ["/dev/t\\y"]
@@ -71,8 +75,7 @@ class TestAppendLetsmeshBrokerToml:
             "mqtt-us-v1.letsmesh.net", "OWNER123", "test@example.com",
         )
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         brokers = data["broker"]
         assert len(brokers) == 1
@@ -97,8 +100,7 @@ class TestAppendLetsmeshBrokerToml:
             "mqtt-eu-v1.letsmesh.net", "", "",
         )
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert len(data["broker"]) == 2
         assert data["broker"][0]["name"] == "letsmesh-us"
@@ -111,8 +113,7 @@ class TestAppendDisabledBrokerToml:
         write_user_toml_base(dest, "SEA", "/dev/ttyACM0", "repo", "main")
         append_disabled_broker_toml(dest, "letsmesh-us")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         broker = data["broker"][0]
         assert broker["name"] == "letsmesh-us"
@@ -124,8 +125,7 @@ class TestAppendDisabledBrokerToml:
         append_disabled_broker_toml(dest, "letsmesh-us")
         append_disabled_broker_toml(dest, "letsmesh-eu")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert len(data["broker"]) == 2
         assert all(b["enabled"] is False for b in data["broker"])
@@ -146,10 +146,8 @@ class TestAppendDisabledBrokerToml:
         write_user_toml_base(str(override), "SEA", "/dev/ttyACM0", "repo", "main")
         append_disabled_broker_toml(str(override), "letsmesh-us")
 
-        with open(base, "rb") as f:
-            base_data = tomllib.load(f)
-        with open(override, "rb") as f:
-            override_data = tomllib.load(f)
+        base_data = _load_toml(base)
+        override_data = _load_toml(override)
 
         result = merge_broker_lists(base_data["broker"], override_data["broker"])
 
@@ -171,8 +169,7 @@ class TestAppendCustomBrokerToml:
             username="user", password="pass",
         )
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         broker = data["broker"][0]
         assert broker["auth"]["method"] == "password"
@@ -188,8 +185,7 @@ class TestAppendCustomBrokerToml:
             audience="aud", owner="owner", email="e@x.com",
         )
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         broker = data["broker"][0]
         assert broker["auth"]["method"] == "token"
@@ -205,8 +201,7 @@ class TestAppendCustomBrokerToml:
             "false", "true", "none",
         )
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["broker"][0]["auth"]["method"] == "none"
 
@@ -218,8 +213,7 @@ class TestAppendCustomBrokerToml:
             "true", "true", "none",
         )
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["broker"][0]["tls"]["enabled"] is True
         assert data["broker"][0]["tls"]["verify"] is True
@@ -232,8 +226,7 @@ class TestAppendCustomBrokerToml:
             "false", "true", "none",
         )
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert "tls" not in data["broker"][0]
 
@@ -244,8 +237,7 @@ class TestAppendRemoteSerialToml:
         write_user_toml_base(dest, "SEA", "/dev/ttyACM0", "repo", "main")
         append_remote_serial_toml(dest, "KEY1,KEY2")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["remote_serial"]["enabled"] is True
         assert data["remote_serial"]["allowed_companions"] == ["KEY1", "KEY2"]
@@ -255,8 +247,7 @@ class TestAppendRemoteSerialToml:
         write_user_toml_base(dest, "SEA", "/dev/ttyACM0", "repo", "main")
         append_remote_serial_toml(dest, "")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["remote_serial"]["enabled"] is False
         assert data["remote_serial"]["allowed_companions"] == []
@@ -343,8 +334,7 @@ class TestPresetFiles:
         copied = copy_preset_to_config(source, config_dir)
 
         assert copied == config_dir / "config.d" / "10-letsmesh.toml"
-        with open(copied, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(copied)
         assert data["broker"][0]["name"] == "letsmesh-us"
 
     def test_import_local_preset(self, tmp_path: Path) -> None:
@@ -412,8 +402,7 @@ class TestAppendTokenOwnerOverridesToml:
         write_user_toml_base(dest, "SEA", "/dev/ttyACM0", "repo", "main")
         append_token_owner_overrides_toml(dest, ["letsmesh-us"], "OWNER123", "test@example.com")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         broker = data["broker"][0]
         assert broker["name"] == "letsmesh-us"
@@ -435,15 +424,31 @@ class TestReadExistingIata:
     def test_nonexistent_file(self) -> None:
         assert _read_existing_iata("/nonexistent/00-user.toml") == ""
 
+    def test_indented_iata(self, tmp_path: Path) -> None:
+        dest = tmp_path / "00-user.toml"
+        dest.write_text('[general]\n  iata = "CDG"  # Paris\n')
+        assert _read_existing_iata(str(dest)) == "CDG"
+
 
 class TestUpdateIataInFile:
+    def test_keeps_trailing_comment(self, tmp_path: Path) -> None:
+        dest = tmp_path / "00-user.toml"
+        dest.write_text('[general]\n  iata = "SEA"  # home airport\n')
+        _update_iata_in_file(str(dest), "LAX")
+        assert dest.read_text() == '[general]\n  iata = "LAX"  # home airport\n'
+
+    def test_replaces_unquoted_value(self, tmp_path: Path) -> None:
+        dest = tmp_path / "00-user.toml"
+        dest.write_text('[general]\niata = SEA\n')
+        _update_iata_in_file(str(dest), "LAX")
+        assert _read_existing_iata(str(dest)) == "LAX"
+
     def test_updates_iata(self, tmp_path: Path) -> None:
         dest = str(tmp_path / "00-user.toml")
         write_user_toml_base(dest, "SEA", "/dev/ttyACM0", "repo", "main")
         _update_iata_in_file(dest, "LAX")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["general"]["iata"] == "LAX"
 
@@ -452,8 +457,7 @@ class TestUpdateIataInFile:
         write_user_toml_base(dest, "SEA", "/dev/ttyACM0", "repo", "main")
         _update_iata_in_file(dest, "LAX")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         assert data["serial"]["ports"] == ["/dev/ttyACM0"]
         assert data["update"]["repo"] == "repo"
@@ -475,8 +479,7 @@ class TestFullComposition:
         )
         append_remote_serial_toml(dest, "KEY1,KEY2")
 
-        with open(dest, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(dest)
 
         # General
         assert data["general"]["iata"] == "SEA"
@@ -594,8 +597,7 @@ class TestRewriteTokenOwnerOverridesPreservesData:
             str(user_toml), ["letsmesh-us"], "OWNER123", "owner@example.com"
         )
 
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["topics"]["status"] == "custom/{IATA}/status"
         assert data["broker"][0]["auth"]["owner"] == "OWNER123"
 
@@ -610,8 +612,7 @@ class TestRewriteTokenOwnerOverridesPreservesData:
             str(user_toml), ["letsmesh-us"], "OWNER", ""
         )
 
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["broker"][0]["metrics"] == {"enabled": True}
         assert data["broker"][0]["auth"]["owner"] == "OWNER"
 
@@ -628,8 +629,7 @@ class TestRewriteTokenOwnerOverridesPreservesData:
             str(user_toml), ["letsmesh-us"], "OWNER", ""
         )
 
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["future_feature"] == {"level": 5, "name": "experimental"}
 
 
@@ -642,8 +642,7 @@ class TestSetRemoteSerial:
 
         _set_remote_serial(str(user_toml), "KEY1,KEY2")
 
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["remote_serial"]["enabled"] is True
         assert data["remote_serial"]["allowed_companions"] == ["KEY1", "KEY2"]
 
@@ -658,8 +657,7 @@ class TestSetRemoteSerial:
         _set_remote_serial(str(user_toml), "NEW1,NEW2")
 
         # File must be valid TOML (a duplicate [remote_serial] would raise here)
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["remote_serial"]["allowed_companions"] == ["NEW1", "NEW2"]
         # Confirm the literal text only contains one [remote_serial] header
         assert user_toml.read_text().count("[remote_serial]") == 1
@@ -672,8 +670,7 @@ class TestSetRemoteSerial:
 
         _set_remote_serial(str(user_toml), "")
 
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["remote_serial"]["enabled"] is False
         assert data["remote_serial"]["allowed_companions"] == []
 
@@ -685,8 +682,7 @@ class TestSetRemoteSerial:
         for csv in ("A,B", "C", "", "D,E,F", "D,E,F"):
             _set_remote_serial(str(user_toml), csv)
 
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["remote_serial"]["allowed_companions"] == ["D", "E", "F"]
         assert user_toml.read_text().count("[remote_serial]") == 1
 
@@ -700,8 +696,7 @@ class TestSetRemoteSerial:
 
         _set_remote_serial(str(user_toml), "KEY1")
 
-        with open(user_toml, "rb") as f:
-            data = tomllib.load(f)
+        data = _load_toml(user_toml)
         assert data["general"]["iata"] == "SEA"
         assert data["topics"]["status"] == "custom/{IATA}"
         assert data["broker"][0]["name"] == "custom"
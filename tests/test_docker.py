@@ -21,62 +21,71 @@ IMAGE_NAME = "mctomqtt-test"
 CONTAINER_NAME = "mctomqtt-test"
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope="module", autouse=True)
 def require_docker() -> None:
     if not os.environ.get("MCTOMQTT_TEST_DOCKER"):
         pytest.skip("Set MCTOMQTT_TEST_DOCKER=1 to run")
 
 
-@pytest.fixture(autouse=True)
-def cleanup_container() -> Generator[None, None, None]:
-    """Remove test container and image after each test."""
-    yield
-    docker = docker_cmd() or "docker"
+@pytest.fixture(scope="module")
+def docker(require_docker: None) -> str | None:
+    """Probe the daemon once per module; each docker_cmd() runs `docker info`."""
+    return docker_cmd()
+
+
+@pytest.fixture(scope="module")
+def built_image(docker: str | None) -> Generator[str, None, None]:
+    """Build the image once for the module and remove it afterwards."""
+    if docker is None:
+        pytest.skip("Docker not available")
+
+    result = subprocess.run(
+        f"{docker} build -t {IMAGE_NAME}:latest {PROJECT_ROOT}".split(),
+        capture_output=True, text=True, timeout=300,
+    )
+    assert result.returncode == 0, f"Build failed: {result.stderr}"
+
+    yield f"{IMAGE_NAME}:latest"
+
     subprocess.run(
-        f"{docker} rm -f {CONTAINER_NAME}".split(),
+        f"{docker} rmi -f {IMAGE_NAME}:latest".split(),
         capture_output=True, check=False,
     )
+
+
+@pytest.fixture(autouse=True)
+def cleanup_container(docker: str | None) -> Generator[None, None, None]:
+    """Remove the test container after each test."""
+    yield
+    if docker is None:
+        return
     subprocess.run(
-        f"{docker} rmi -f {IMAGE_NAME}:latest".split(),
+        f"{docker} rm -f {CONTAINER_NAME}".split(),
         capture_output=True, check=False,
     )
 
 
 class TestDocker:
-    def test_docker_cmd_available(self) -> None:
-        result = docker_cmd()
-        assert result is not None, "Docker not available"
-        assert "docker" in result
+    def test_docker_cmd_available(self, docker: str | None) -> None:
+        assert docker is not None, "Docker not available"
+        assert "docker" in docker
 
-    def test_build_image(self) -> None:
-        docker = docker_cmd()
+    def test_build_image(self, docker: str | None, built_image: str) -> None:
         assert docker is not None
-        result = subprocess.run(
-            f"{docker} build -t {IMAGE_NAME}:latest {PROJECT_ROOT}".split(),
-            capture_output=True, text=True, timeout=300,
-        )
-        assert result.returncode == 0, f"Build failed: {result.stderr}"
 
         # Verify image exists
         result = subprocess.run(
-            f"{docker} images {IMAGE_NAME}:latest --format {{{{.Repository}}}}".split(),
+            f"{docker} images {built_image} --format {{{{.Repository}}}}".split(),
             capture_output=True, text=True,
         )
         assert IMAGE_NAME in result.stdout
 
-    def test_container_starts(self) -> None:
-        docker = docker_cmd()
+    def test_container_starts(self, docker: str | None, built_image: str) -> None:
         assert docker is not None
 
-        # Build first
-        subprocess.run(
-            f"{docker} build -t {IMAGE_NAME}:latest {PROJECT_ROOT}".split(),
-            capture_output=True, check=True, timeout=300,
-        )
-
         # Run container (it will likely fail without serial device, but should start)
         result = subprocess.run(
-            f"{docker} run -d --name {CONTAINER_NAME} {IMAGE_NAME}:latest".split(),
+            f"{docker} run -d --name {CONTAINER_NAME} {built_image}".split(),
             capture_output=True, text=True,
         )
         assert result.returncode == 0, f"Container start failed: {result.stderr}"
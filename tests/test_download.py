@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import subprocess
+import threading
 import zipfile
+from collections.abc import Generator
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,6 +16,34 @@ import pytest
 from installer.system import download_file, download_repo_archive
 
 
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def local_github(tmp_path_factory: pytest.TempPathFactory) -> Generator[str, None, None]:
+    """Serve a README and a GitHub-style repo archive from localhost."""
+    root = tmp_path_factory.mktemp("gh")
+    (root / "README.md").write_text("# meshcoretomqtt\n")
+
+    archive = root / "Cisien" / "meshcoretomqtt" / "archive" / "refs" / "heads" / "main.zip"
+    archive.parent.mkdir(parents=True)
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in ("mctomqtt.py", "auth_token.py", "README.md"):
+            zf.writestr(f"meshcoretomqtt-main/{name}", f"# {name}\n")
+
+    handler = functools.partial(_QuietHandler, directory=str(root))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 class TestRepoArchiveSlashBranch:
     """Verify download_repo_archive handles branch names containing slashes."""
 
@@ -59,6 +91,37 @@ class TestRepoArchiveSlashBranch:
         assert Path(result).name == "meshcoretomqtt-main"
 
 
+class TestDownloadLocal:
+    """Same download paths as the network tests, against a local HTTP server."""
+
+    def test_download_file(self, tmp_path: Path, local_github: str) -> None:
+        dest = tmp_path / "README.md"
+        with patch("installer.system.print_info"):
+            download_file(f"{local_github}/README.md", str(dest), "README.md")
+        assert "meshcoretomqtt" in dest.read_text()
+
+    def test_download_file_missing_raises(self, tmp_path: Path, local_github: str) -> None:
+        with patch("installer.system.print_info"), \
+             pytest.raises(subprocess.CalledProcessError):
+            download_file(f"{local_github}/DOES_NOT_EXIST", str(tmp_path / "x"), "x")
+
+    def test_download_repo_archive(self, tmp_path: Path, local_github: str) -> None:
+        with patch("installer.system.GITHUB_BASE_URL", local_github), \
+             patch("installer.system.print_info"), \
+             patch("installer.system.print_success"):
+            repo_dir = download_repo_archive("Cisien/meshcoretomqtt", "main", str(tmp_path))
+        repo_path = Path(repo_dir)
+        assert repo_path.name == "meshcoretomqtt-main"
+        assert (repo_path / "mctomqtt.py").exists()
+        assert not (tmp_path / "repo.zip").exists()
+
+    def test_download_repo_archive_missing_branch_raises(self, tmp_path: Path, local_github: str) -> None:
+        with patch("installer.system.GITHUB_BASE_URL", local_github), \
+             patch("installer.system.print_info"), \
+             pytest.raises(subprocess.CalledProcessError):
+            download_repo_archive("Cisien/meshcoretomqtt", "nope", str(tmp_path))
+
+
 @pytest.mark.network
 class TestDownloadFile:
     def test_download_known_file(self, tmp_path: Path) -> None:
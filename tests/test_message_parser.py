@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 import pytest
 
-from bridge.message_parser import RAW_PATTERN, PACKET_PATTERN, parse_and_publish
+from bridge.message_parser import RAW_PATTERN, PACKET_PATTERN, encode_message, parse_and_publish
 from bridge.mqtt_publish import publish_status
 from tests.fakes import FakeBrokerClient, make_test_state, make_config
 
@@ -45,6 +46,29 @@ class TestPacketPattern:
         assert match is not None
         assert match.group(3) == "TX"
 
+    def test_rejects_non_ascii_digits(self):
+        # Arabic-Indic digits satisfy a Unicode \d but never come from the radio
+        line = "12:34:56 - 1/15/2025 U: TX, len=\u0663\u0662 (type=2, route=F, payload_len=16)"
+        assert PACKET_PATTERN.match(line) is None
+
+
+class TestEncodeMessage:
+    def test_matches_json_dumps(self):
+        state = make_test_state(repeater_name='Node "1"', repeater_pub_key="AA" * 32)
+        body = {"timestamp": "2025-01-15T12:34:56+00:00", "type": "PACKET", "raw": None}
+        expected = json.dumps({"origin": 'Node "1"', "origin_id": "AA" * 32, **body})
+        assert encode_message(state, body) == expected
+
+    def test_empty_body(self):
+        state = make_test_state(repeater_name="Node", repeater_pub_key=None)
+        assert encode_message(state, {}) == json.dumps({"origin": "Node", "origin_id": None})
+
+    def test_prefix_follows_identity_change(self):
+        state = make_test_state(repeater_name="Node", repeater_pub_key="AA" * 32)
+        encode_message(state, {"type": "DEBUG"})
+        state.repeater_name = "Renamed"
+        assert json.loads(encode_message(state, {"type": "DEBUG"}))["origin"] == "Renamed"
+
 
 class TestParseAndPublish:
     def _make_state(self):
@@ -67,6 +91,17 @@ class TestParseAndPublish:
         assert msg['direction'] == "rx"
         assert state.stats['packets_rx'] == 1
 
+    def test_rx_packet_field_order(self):
+        state, broker = self._make_state()
+        line = "12:34:56 - 1/15/2025 U: RX, len=64 (type=1, route=D, payload_len=48) SNR=10 RSSI=-80 score=100 [BB -> AA]"
+        parse_and_publish(state, line)
+        msg = json.loads(broker.published[0][1])
+        assert list(msg) == [
+            "origin", "origin_id", "timestamp", "type", "direction", "time", "date", "len",
+            "packet_type", "route", "payload_len", "raw", "SNR", "RSSI", "score", "duration",
+            "hash", "path",
+        ]
+
     def test_tx_packet(self):
         state, broker = self._make_state()
         line = "12:34:56 - 1/15/2025 U: TX, len=32 (type=2, route=F, payload_len=16)"
@@ -93,11 +128,24 @@ class TestParseAndPublish:
         msg = json.loads(broker.published[0][1])
         assert msg['type'] == "DEBUG"
 
+    def test_junk_does_not_format_timestamp(self):
+        state, broker = self._make_state()
+        with patch("bridge.message_parser.datetime") as dt:
+            parse_and_publish(state, "12:34:56 - 1/15/2025 U RAW: AABB")
+            parse_and_publish(state, "random garbage line")
+        dt.now.assert_not_called()
+
     def test_ignores_junk(self):
         state, broker = self._make_state()
         parse_and_publish(state, "random garbage line")
         assert len(broker.published) == 0
 
+    def test_ignores_marker_without_packet_fields(self):
+        state, broker = self._make_state()
+        parse_and_publish(state, "12:34:56 - 1/15/2025 U: something else")
+        assert len(broker.published) == 0
+        assert state.stats['packets_rx'] == 0
+
     def test_empty_line(self):
         state, broker = self._make_state()
         parse_and_publish(state, "")
@@ -126,6 +174,36 @@ class TestParseAndPublish:
         assert msg['path'] == "BB -> AA"
 
 
+class TestPublishQos:
+    def _make_state(self, qos: int):
+        config = make_config()
+        config['broker'][0]['qos'] = qos
+        broker = FakeBrokerClient()
+        broker._connected = True
+        state = make_test_state(
+            config=config,
+            broker_clients=[{"client": broker, "broker_idx": 0, "connected": True}],
+            repeater_name="TestNode",
+            repeater_pub_key="AA" * 32,
+        )
+        return state, broker
+
+    def test_packets_always_qos0(self):
+        state, broker = self._make_state(qos=2)
+        parse_and_publish(state, "12:34:56 - 1/15/2025 U: TX, len=32 (type=2, route=F, payload_len=16)")
+        assert broker.published[0][2] == 0
+
+    def test_status_uses_broker_qos(self):
+        state, broker = self._make_state(qos=2)
+        publish_status(state, "online")
+        assert broker.published[0][2] == 2
+
+    def test_status_qos1_downgraded(self):
+        state, broker = self._make_state(qos=1)
+        publish_status(state, "online")
+        assert broker.published[0][2] == 0
+
+
 class TestIataInPublishedTopics:
     """End-to-end: configured IATA must appear in every MQTT topic, never SEA."""
 
@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from bridge.mqtt_manager import MqttManager
+from bridge.mqtt_manager import JITTER_TABLE_SIZE, MqttManager
 from tests.fakes import FakeBrokerClient, make_test_state, make_config
 
 
@@ -44,15 +44,72 @@ class TestMqttManagerCallbacks:
         assert state.mqtt_connected is False
 
     def test_on_disconnect_marks_disconnected(self):
-        state, manager = self._make_manager()
-        state.mqtt_clients = [{"client": FakeBrokerClient(), "broker_idx": 0, "connected": True, "connecting_since": 0, "connect_time": 100, "reconnect_at": 0, "failed_attempts": 0}]
-        state.mqtt_connected = True
+        state, manager = self._make_manager(broker_clients=[
+            {"client": FakeBrokerClient(), "broker_idx": 0, "connected": True, "connecting_since": 0, "connect_time": 100, "reconnect_at": 0, "failed_attempts": 0},
+        ])
 
         manager.on_mqtt_disconnect(None, {'name': 'test', 'broker_idx': 0}, None, 0, None)
 
         assert state.mqtt_clients[0]['connected'] is False
         assert state.mqtt_connected is False
 
+    def test_on_disconnect_keeps_connected_while_other_broker_up(self):
+        state, manager = self._make_manager()
+        import threading
+        state.mqtt_clients = [
+            {"client": FakeBrokerClient(), "broker_idx": i, "connected": False, "connecting_since": 1, "connect_time": 0, "failed_attempts": 0}
+            for i in range(2)
+        ]
+        for i in range(2):
+            state.connection_events[i] = threading.Event()
+            manager.on_mqtt_connect(None, {'name': f'b{i}', 'broker_idx': i}, None, 0)
+        assert state.mqtt_connected_count == 2
+
+        manager.on_mqtt_disconnect(None, {'name': 'b0', 'broker_idx': 0}, None, 0, None)
+        assert state.mqtt_connected is True
+
+        # A duplicate disconnect callback must not double-count
+        manager.on_mqtt_disconnect(None, {'name': 'b0', 'broker_idx': 0}, None, 0, None)
+        assert state.mqtt_connected_count == 1
+        assert state.mqtt_connected is True
+
+        manager.on_mqtt_disconnect(None, {'name': 'b1', 'broker_idx': 1}, None, 0, None)
+        assert state.mqtt_connected_count == 0
+        assert state.mqtt_connected is False
+
+    def test_duplicate_connect_counts_once(self):
+        state, manager = self._make_manager()
+        import threading
+        state.mqtt_clients = [{"client": FakeBrokerClient(), "broker_idx": 0, "connected": False, "connecting_since": 1, "connect_time": 0, "failed_attempts": 0}]
+        state.connection_events[0] = threading.Event()
+
+        manager.on_mqtt_connect(None, {'name': 'test', 'broker_idx': 0}, None, 0)
+        manager.on_mqtt_connect(None, {'name': 'test', 'broker_idx': 0}, None, 0)
+        assert state.mqtt_connected_count == 1
+
+        manager.on_mqtt_disconnect(None, {'name': 'test', 'broker_idx': 0}, None, 0, None)
+        assert state.mqtt_connected_count == 0
+        assert state.mqtt_connected is False
+
+    def test_on_disconnect_unmatched_broker_keeps_count(self):
+        state, manager = self._make_manager()
+        import threading
+        state.mqtt_clients = [
+            {"client": FakeBrokerClient(), "broker_idx": i, "connected": False, "connecting_since": 1, "connect_time": 0, "failed_attempts": 0}
+            for i in range(2)
+        ]
+        for i in range(2):
+            state.connection_events[i] = threading.Event()
+            manager.on_mqtt_connect(None, {'name': f'b{i}', 'broker_idx': i}, None, 0)
+
+        # A stale index and missing userdata match no broker entry
+        manager.on_mqtt_disconnect(None, {'name': 'stale', 'broker_idx': 5}, None, 0, None)
+        manager.on_mqtt_disconnect(None, None, None, 0, None)
+
+        assert state.mqtt_connected_count == 2
+        assert state.mqtt_connected is True
+        assert all(info['connected'] for info in state.mqtt_clients)
+
     def test_on_message_ignores_non_serial(self):
         state, manager = self._make_manager()
         msg = type('Msg', (), {'topic': 'other/topic', 'payload': b'test'})()
@@ -61,6 +118,28 @@ class TestMqttManagerCallbacks:
 
 
 class TestReconnectBehavior:
+    def test_jitter_cycles_through_table(self):
+        manager = MqttManager(make_test_state())
+        values = [manager._next_jitter() for _ in range(2 * JITTER_TABLE_SIZE)]
+        assert all(-0.5 <= v <= 0.5 for v in values)
+        assert values[:JITTER_TABLE_SIZE] == values[JITTER_TABLE_SIZE:]
+
+    def test_reconnect_at_uses_monotonic_clock(self):
+        state = make_test_state(repeater_name="Node", repeater_pub_key="AA" * 32)
+        manager = MqttManager(state)
+        state.mqtt_clients = [{
+            "client": FakeBrokerClient(), "broker_idx": 0, "connected": False,
+            "connecting_since": 0, "connect_time": 0, "reconnect_at": 0,
+            "reconnect_delay": 1.0, "failed_attempts": 0,
+        }]
+
+        with patch.object(manager, '_create_and_connect_broker', return_value=None), \
+                patch('bridge.mqtt_manager.time.time', return_value=0.0):
+            before = time.monotonic()
+            manager.reconnect_disconnected_brokers()
+
+        assert before + 0.5 <= state.mqtt_clients[0]['reconnect_at'] <= time.monotonic() + 1.5
+
     def test_skips_connected_brokers(self):
         state = make_test_state(repeater_name="TestNode", repeater_pub_key="AA" * 32)
         manager = MqttManager(state)
@@ -130,7 +209,7 @@ class TestReconnectBehavior:
                 'broker_idx': idx,
                 'connected': connected,
                 'connecting_since': 0,
-                'connect_time': time.time() - 300 if connected else 0,
+                'connect_time': time.monotonic() - 300 if connected else 0,
                 'reconnect_at': 0,
                 'reconnect_delay': 1.0,
                 'failed_attempts': 0,
@@ -150,9 +229,9 @@ class TestReconnectBehavior:
             "broker 1 delay must be unaffected by broker 0 failures"
 
         # Broker 1 disconnects — reconnect_at should use its own delay (1.0)
-        t_before = time.time()
+        t_before = time.monotonic()
         manager.on_mqtt_disconnect(None, {'name': 'b1', 'broker_idx': 1}, None, 0, None)
-        t_after = time.time()
+        t_after = time.monotonic()
 
         assert state.mqtt_clients[1]['reconnect_delay'] == 1.0
         assert t_before + 1.0 <= state.mqtt_clients[1]['reconnect_at'] <= t_after + 1.0
@@ -164,6 +164,13 @@ class TestCleanupNonces:
         cleanup_old_nonces(state)
         assert "fresh_nonce" in state.remote_serial_nonces
 
+    def test_stops_at_first_fresh(self):
+        state = _make_remote_state()
+        now = int(time.time())
+        state.remote_serial_nonces = {"a": now - 300, "b": now - 200, "c": now, "d": now}
+        cleanup_old_nonces(state)
+        assert list(state.remote_serial_nonces) == ["c", "d"]
+
 
 class TestParseAllowedCompanions:
     def test_valid_keys(self):
@@ -1,11 +1,19 @@
 """Tests for runner startup and main loop logic."""
 from __future__ import annotations
 
-from unittest.mock import patch
+import logging
+import os
+import signal
+import time
+from unittest.mock import MagicMock
 
 import pytest
 
-from bridge.runner import load_client_version, handle_signal
+from bridge import runner
+from bridge.runner import (
+    enqueue_line, install_wakeup_fd, load_client_version, handle_signal, remove_wakeup_fd,
+    wait_for_system_time_sync,
+)
 from tests.fakes import FakeSerialConnection, FakeAuthProvider, make_test_state
 
 
@@ -27,6 +35,41 @@ class TestHandleSignal:
         assert state.should_exit is True
 
 
+class TestWakeupFd:
+    def test_signal_writes_to_wakeup_pipe(self):
+        state = make_test_state()
+        previous = signal.signal(signal.SIGUSR1, lambda *_: None)
+        try:
+            install_wakeup_fd(state)
+            assert state.wakeup_pipe is not None
+            os.kill(os.getpid(), signal.SIGUSR1)
+            assert os.read(state.wakeup_pipe[0], 16)
+        finally:
+            remove_wakeup_fd(state)
+            signal.signal(signal.SIGUSR1, previous)
+        assert state.wakeup_pipe is None
+
+    def test_remove_without_install_is_noop(self):
+        state = make_test_state()
+        remove_wakeup_fd(state)
+        assert state.wakeup_pipe is None
+
+
+class TestWaitForSystemTimeSync:
+    def test_returns_immediately_when_timesyncd_flag_present(self, tmp_path):
+        flag = tmp_path / "synchronized"
+        flag.touch()
+        state = make_test_state()
+        start = time.monotonic()
+        assert wait_for_system_time_sync(state, sync_flag=str(flag)) is True
+        assert time.monotonic() - start < 1
+
+    def test_gives_up_when_exit_requested(self, tmp_path):
+        state = make_test_state()
+        state.should_exit = True
+        assert wait_for_system_time_sync(state, sync_flag=str(tmp_path / "missing")) is True
+
+
 class TestStartupPopulatesState:
     """Test that startup queries populate state correctly using FakeSerialConnection."""
 
@@ -61,17 +104,16 @@ class TestStartupPopulatesState:
         assert state.model == "Station G2"
         assert state.stats['device'] == {'battery_mv': 4200}
 
-    def test_fails_no_name(self):
-        device = FakeSerialConnection(name=None)
+    @pytest.mark.parametrize("field, getter, attr", [
+        ("name", "get_name", "repeater_name"),
+        ("pubkey", "get_pubkey", "repeater_pub_key"),
+        ("firmware", "get_firmware_version", "firmware_version"),
+    ])
+    def test_missing_field_leaves_state_unset(self, field, getter, attr):
+        device = FakeSerialConnection(**{field: None})
         state = make_test_state(device=device)
-        state.repeater_name = state.device.get_name()
-        assert state.repeater_name is None
-
-    def test_fails_no_pubkey(self):
-        device = FakeSerialConnection(pubkey=None)
-        state = make_test_state(device=device)
-        state.repeater_pub_key = state.device.get_pubkey()
-        assert state.repeater_pub_key is None
+        setattr(state, attr, getattr(state.device, getter)())
+        assert getattr(state, attr) is None
 
     def test_continues_without_privkey(self):
         device = FakeSerialConnection(privkey=None)
@@ -84,12 +126,6 @@ class TestStartupPopulatesState:
         assert state.repeater_pub_key is not None
         assert state.repeater_priv_key is None
 
-    def test_continues_without_firmware(self):
-        device = FakeSerialConnection(firmware=None)
-        state = make_test_state(device=device)
-        state.firmware_version = state.device.get_firmware_version()
-        assert state.firmware_version is None
-
 
 class TestMainLoopReadsAndParses:
     def test_read_line_feeds_to_parser(self):
@@ -108,6 +144,25 @@ class TestMainLoopReadsAndParses:
         assert state.device.read_line() is None
 
 
+class TestEnqueueLine:
+    def test_queues_line_for_publisher(self):
+        state = make_test_state()
+        enqueue_line(state, "line 1")
+        assert state.line_queue.get_nowait() == "line 1"
+        assert state.stats['lines_dropped'] == 0
+
+    def test_drops_oldest_when_full(self):
+        state = make_test_state()
+        for i in range(state.line_queue.maxsize):
+            enqueue_line(state, f"line {i}")
+
+        enqueue_line(state, "newest")
+
+        assert state.stats['lines_dropped'] == 1
+        assert state.line_queue.qsize() == state.line_queue.maxsize
+        assert state.line_queue.get_nowait() == "line 1"
+
+
 class TestFullStartupFlow:
     """Integration test: all fakes wired together, verify end-to-end initialization."""
 
@@ -148,11 +203,23 @@ class TestFullStartupFlow:
         assert state.client_version.startswith("meshcoretomqtt/1.0.8.0")
 
 
+@pytest.fixture
+def mock_serial_conn(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr("bridge.runner.serial_connection", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_time(monkeypatch):
+    mock = MagicMock()
+    monkeypatch.setattr("bridge.runner.time", mock)
+    return mock
+
+
 class TestNullDeviceReconnection:
     """Test that the main loop retries connection when state.device is None."""
 
-    @patch('bridge.runner.serial_connection')
-    @patch('bridge.runner.time')
     def test_retries_connection_when_device_is_none(self, mock_time, mock_serial_conn):
         """When device is None and reconnect interval has elapsed, retry connect."""
         from bridge import runner
@@ -178,8 +245,6 @@ class TestNullDeviceReconnection:
         assert state.device is new_device
         mock_serial_conn.connect.assert_called_once_with(state.config)
 
-    @patch('bridge.runner.serial_connection')
-    @patch('bridge.runner.time')
     def test_skips_reconnect_within_interval(self, mock_time, mock_serial_conn):
         """When device is None but interval hasn't elapsed, don't retry."""
         state = make_test_state()
@@ -195,8 +260,6 @@ class TestNullDeviceReconnection:
         # connect should not be called
         mock_serial_conn.connect.assert_not_called()
 
-    @patch('bridge.runner.serial_connection')
-    @patch('bridge.runner.time')
     def test_logs_warning_once_on_repeated_failure(self, mock_time, mock_serial_conn):
         """Warning is logged only once when device stays unavailable."""
         import logging
@@ -228,8 +291,6 @@ class TestNullDeviceReconnection:
         # watchdog_logged stays True — no re-logging
         assert watchdog_logged is True
 
-    @patch('bridge.runner.serial_connection')
-    @patch('bridge.runner.time')
     def test_resets_watchdog_on_successful_reconnect(self, mock_time, mock_serial_conn):
         """watchdog_logged resets to False when reconnect succeeds."""
         state = make_test_state()
@@ -250,3 +311,40 @@ class TestNullDeviceReconnection:
             watchdog_logged = False
         assert state.device is new_device
         assert watchdog_logged is False
+
+    def test_reattaches_as_soon_as_port_reappears(self, mock_time, mock_serial_conn, monkeypatch, caplog):
+        """Runs the real main loop: device lost, port absent, port back."""
+        state = make_test_state()
+        state.sync_time_at_start = False
+        state.mqtt_manager = MagicMock()
+        state.mqtt_manager.connect_all_brokers.return_value = True
+
+        class UnpluggedDevice(FakeSerialConnection):
+            def read_line(self):
+                raise OSError("device unplugged")
+
+        class ReattachedDevice(FakeSerialConnection):
+            def read_line(self):
+                state.should_exit = True
+                return None
+
+        reattached = ReattachedDevice()
+        # startup, reopen after the OSError, retry while present, reattach
+        mock_serial_conn.connect.side_effect = [UnpluggedDevice(), None, None, reattached]
+        # present (retry fails), present (inside backoff), absent x3, back
+        mock_serial_conn.ports_present.side_effect = [True, True, False, False, False, True]
+        # The clock never moves, so only the reappearance can bypass the backoff
+        mock_time.monotonic.return_value = 100.0
+
+        for name in ("background", "MeshCoreAuthProvider", "log_config_sources",
+                     "install_wakeup_fd", "remove_wakeup_fd", "sleep", "_idle_wait"):
+            monkeypatch.setattr(runner, name, MagicMock())
+
+        with caplog.at_level(logging.WARNING, logger="bridge.runner"):
+            runner.run(state)
+
+        assert mock_serial_conn.connect.call_count == 4
+        assert mock_serial_conn.ports_present.call_count == 6
+        assert state.device is reattached
+        absent = [r for r in caplog.records if "not present" in r.getMessage()]
+        assert len(absent) == 1
@@ -1,13 +1,14 @@
 """Tests for RealSerialConnection parsing logic with mock serial.Serial."""
 from __future__ import annotations
 
+import os
 import time
 from unittest.mock import MagicMock, PropertyMock
 
 import serial
 import pytest
 
-from bridge.serial_connection import RealSerialConnection, connect
+from bridge.serial_connection import MAX_LINE_LENGTH, RealSerialConnection, connect, ports_present, _enable_low_latency
 
 
 def _make_conn(read_all_value: bytes | list[bytes] = b"") -> tuple[RealSerialConnection, MagicMock]:
@@ -234,7 +235,7 @@ class TestReadLine:
         mock_port = MagicMock(spec=serial.Serial)
         mock_port.is_open = True
         mock_port.in_waiting = 10
-        mock_port.readline.return_value = b"test line\n"
+        mock_port.read.return_value = b"test line\n"
         conn = RealSerialConnection(mock_port)
         assert conn.read_line() == "test line"
 
@@ -242,12 +243,71 @@ class TestReadLine:
         mock_port = MagicMock(spec=serial.Serial)
         mock_port.is_open = True
         mock_port.in_waiting = 10
-        mock_port.readline.return_value = b"test line\n"
+        mock_port.read.return_value = b"test line\n"
         conn = RealSerialConnection(mock_port)
         conn._last_activity = time.time() - 100
         conn.read_line()
         assert conn.seconds_since_activity() < 1
 
+    def test_splits_multiple_lines_from_one_read(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.is_open = True
+        mock_port.in_waiting = 12
+        mock_port.read.return_value = b"one\r\ntwo\r\n"
+        conn = RealSerialConnection(mock_port)
+        assert conn.read_line() == "one"
+        mock_port.in_waiting = 0
+        assert conn.read_line() == "two"
+        assert mock_port.read.call_count == 1
+        assert conn.read_line() is None
+
+    def test_holds_partial_line_until_newline(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.is_open = True
+        mock_port.in_waiting = 4
+        mock_port.read.side_effect = [b"par", b"tial\n"]
+        conn = RealSerialConnection(mock_port)
+        assert conn.read_line() is None
+        assert conn.read_line() == "partial"
+
+    def test_completes_partial_line_after_full_line(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.is_open = True
+        mock_port.in_waiting = 8
+        mock_port.read.side_effect = [b"one\npar", b"tial\n"]
+        conn = RealSerialConnection(mock_port)
+        assert conn.read_line() == "one"
+        assert conn.read_line() == "partial"
+        assert conn._rx_buf == bytearray()
+
+    def test_flushes_line_longer_than_max(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.is_open = True
+        mock_port.in_waiting = MAX_LINE_LENGTH
+        mock_port.read.side_effect = [b"A" * MAX_LINE_LENGTH, b"B", b"C\n"]
+        conn = RealSerialConnection(mock_port)
+        assert conn.read_line() is None
+        assert conn.read_line() == "A" * MAX_LINE_LENGTH + "B"
+        assert len(conn._rx_buf) == 0
+        assert conn.read_line() == "C"
+
+    def test_skips_blank_lines(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.is_open = True
+        mock_port.in_waiting = 8
+        mock_port.read.return_value = b"\r\n\r\ndata\n"
+        conn = RealSerialConnection(mock_port)
+        assert conn.read_line() == "data"
+
+    def test_idle_read_skips_lock(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.is_open = True
+        mock_port.in_waiting = 0
+        conn = RealSerialConnection(mock_port)
+        conn._lock = MagicMock()
+        assert conn.read_line() is None
+        conn._lock.__enter__.assert_not_called()
+
     def test_does_not_update_activity_when_empty(self):
         mock_port = MagicMock(spec=serial.Serial)
         mock_port.is_open = True
@@ -258,6 +318,77 @@ class TestReadLine:
         assert conn.seconds_since_activity() >= 99
 
 
+# ------------------------------------------------------------------
+# wait_for_data
+# ------------------------------------------------------------------
+
+class TestWaitForData:
+    def test_returns_immediately_when_buffered(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.in_waiting = 10
+        conn = RealSerialConnection(mock_port)
+        assert conn.wait_for_data(5.0) is True
+
+    def test_returns_immediately_when_line_pending(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.in_waiting = 0
+        conn = RealSerialConnection(mock_port)
+        conn._rx_buf += b"queued\n"
+        assert conn.wait_for_data(5.0) is True
+
+    def test_wakes_when_fd_readable(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            mock_port = MagicMock(spec=serial.Serial)
+            mock_port.in_waiting = 0
+            mock_port.fileno.return_value = read_fd
+            conn = RealSerialConnection(mock_port)
+            os.write(write_fd, b"line\n")
+            assert conn.wait_for_data(5.0) is True
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_times_out_when_idle(self):
+        read_fd, write_fd = os.pipe()
+        try:
+            mock_port = MagicMock(spec=serial.Serial)
+            mock_port.in_waiting = 0
+            mock_port.fileno.return_value = read_fd
+            conn = RealSerialConnection(mock_port)
+            assert conn.wait_for_data(0.05) is False
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_wake_fd_interrupts_wait(self):
+        read_fd, write_fd = os.pipe()
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        try:
+            mock_port = MagicMock(spec=serial.Serial)
+            mock_port.in_waiting = 0
+            mock_port.fileno.return_value = read_fd
+            conn = RealSerialConnection(mock_port)
+            os.write(wake_w, b"\x0f")
+            start = time.monotonic()
+            assert conn.wait_for_data(5.0, wake_r) is False
+            assert time.monotonic() - start < 1.0
+            # The wakeup byte was consumed
+            with pytest.raises(BlockingIOError):
+                os.read(wake_r, 1)
+        finally:
+            for fd in (read_fd, write_fd, wake_r, wake_w):
+                os.close(fd)
+
+    def test_falls_back_without_fileno(self):
+        mock_port = MagicMock(spec=serial.Serial)
+        mock_port.in_waiting = 0
+        mock_port.fileno.side_effect = AttributeError
+        conn = RealSerialConnection(mock_port)
+        assert conn.wait_for_data(0.05) is False
+
+
 # ------------------------------------------------------------------
 # seconds_since_activity (watchdog)
 # ------------------------------------------------------------------
@@ -320,3 +451,33 @@ class TestConnectFactory:
         }
         result = connect(config)
         assert result is None
+
+
+class TestPortsPresent:
+    def test_existing_device_path(self, tmp_path):
+        dev = tmp_path / "ttyACM0"
+        dev.touch()
+        assert ports_present({'serial': {'ports': [str(tmp_path / "missing"), str(dev)]}}) is True
+
+    def test_missing_device_paths(self, tmp_path):
+        assert ports_present({'serial': {'ports': [str(tmp_path / "ttyACM0")]}}) is False
+
+    def test_non_path_ports_assumed_present(self):
+        assert ports_present({'serial': {'ports': ['COM3']}}) is True
+        assert ports_present({'serial': {'ports': ['rfc2217://host:4000']}}) is True
+
+
+class TestEnableLowLatency:
+    def test_sets_low_latency_mode(self):
+        mock_port = MagicMock()
+        _enable_low_latency(mock_port)
+        mock_port.set_low_latency_mode.assert_called_once_with(True)
+
+    def test_ignores_unsupported_driver(self):
+        mock_port = MagicMock()
+        mock_port.set_low_latency_mode.side_effect = OSError("Inappropriate ioctl for device")
+        _enable_low_latency(mock_port)  # Should not raise
+
+    def test_ignores_platform_without_support(self):
+        mock_port = MagicMock(spec=["port", "write"])
+        _enable_low_latency(mock_port)  # Should not raise
@@ -23,21 +23,24 @@ def serial_device() -> str:
     return device
 
 
+@pytest.fixture(scope="module")
+def detected_devices() -> list[str]:
+    """Scan once per module; both tests inspect the same detection result."""
+    if not os.environ.get("MCTOMQTT_TEST_SERIAL_DEVICE"):
+        pytest.skip("Set MCTOMQTT_TEST_SERIAL_DEVICE=/dev/ttyACM0 to run")
+    return detect_serial_devices()
+
+
 class TestDetectSerialDevices:
-    def test_detects_env_device(self, serial_device: str) -> None:
-        devices = detect_serial_devices()
+    def test_detects_env_device(self, serial_device: str, detected_devices: list[str]) -> None:
         # The device or its symlink target should be in the list
-        serial_resolved = str(Path(serial_device).resolve())
-        found = False
-        for d in devices:
-            if d == serial_device or str(Path(d).resolve()) == serial_resolved:
-                found = True
-                break
-        assert found, f"{serial_device} not in detected devices: {devices}"
-
-    def test_at_least_one_char_device(self, serial_device: str) -> None:
-        devices = detect_serial_devices()
-        assert len(devices) > 0
+        candidates = set(detected_devices)
+        candidates.update(str(Path(d).resolve()) for d in detected_devices)
+        assert {serial_device, str(Path(serial_device).resolve())} & candidates, \
+            f"{serial_device} not in detected devices: {detected_devices}"
+
+    def test_at_least_one_char_device(self, serial_device: str, detected_devices: list[str]) -> None:
+        assert len(detected_devices) > 0
         # At least one should be a real character device
-        has_char = any(Path(d).resolve().is_char_device() for d in devices)
-        assert has_char, f"No character devices in: {devices}"
+        has_char = any(Path(d).resolve().is_char_device() for d in detected_devices)
+        assert has_char, f"No character devices in: {detected_devices}"
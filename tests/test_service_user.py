@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import grp
 import platform
+import pwd
+import shutil
 import subprocess
 from collections.abc import Generator
+from pathlib import Path
 
 import pytest
 
@@ -31,52 +35,36 @@ def cleanup_test_user() -> Generator[None, None, None]:
         ["groupdel", TEST_USER],
         capture_output=True, check=False,
     )
-    subprocess.run(
-        ["rm", "-rf", TEST_DIR],
-        capture_output=True, check=False,
-    )
+    shutil.rmtree(TEST_DIR, ignore_errors=True)
 
 
 class TestCreateSystemUser:
     def test_creates_user(self) -> None:
-        subprocess.run(["mkdir", "-p", TEST_DIR], check=True)
+        Path(TEST_DIR).mkdir(parents=True, exist_ok=True)
         create_system_user(TEST_USER, TEST_DIR)
 
-        result = subprocess.run(
-            ["id", TEST_USER], capture_output=True, text=True,
-        )
-        assert result.returncode == 0
-        result = subprocess.run(
-            ["getent", "group", TEST_USER], capture_output=True, text=True,
-        )
-        assert result.returncode == 0
+        # getpwnam/getgrnam raise KeyError if the entry is missing
+        assert pwd.getpwnam(TEST_USER).pw_name == TEST_USER
+        assert grp.getgrnam(TEST_USER).gr_name == TEST_USER
 
     def test_nologin_shell(self) -> None:
-        subprocess.run(["mkdir", "-p", TEST_DIR], check=True)
+        Path(TEST_DIR).mkdir(parents=True, exist_ok=True)
         create_system_user(TEST_USER, TEST_DIR)
 
-        result = subprocess.run(
-            ["getent", "passwd", TEST_USER],
-            capture_output=True, text=True,
-        )
-        assert result.returncode == 0
-        # Last field is the shell
-        shell = result.stdout.strip().split(":")[-1]
-        assert "nologin" in shell
+        assert "nologin" in pwd.getpwnam(TEST_USER).pw_shell
 
     def test_serial_group_membership(self) -> None:
-        subprocess.run(["mkdir", "-p", TEST_DIR], check=True)
+        Path(TEST_DIR).mkdir(parents=True, exist_ok=True)
         create_system_user(TEST_USER, TEST_DIR)
 
-        result = subprocess.run(
-            ["groups", TEST_USER], capture_output=True, text=True,
-        )
+        user = pwd.getpwnam(TEST_USER)
+        groups = {g.gr_name for g in grp.getgrall() if TEST_USER in g.gr_mem}
+        groups.add(grp.getgrgid(user.pw_gid).gr_name)
         # Should be in either dialout or uucp depending on distro
-        groups_str = result.stdout.lower()
-        assert "dialout" in groups_str or "uucp" in groups_str
+        assert groups & {"dialout", "uucp"}
 
     def test_idempotent(self, capsys: pytest.CaptureFixture[str]) -> None:
-        subprocess.run(["mkdir", "-p", TEST_DIR], check=True)
+        Path(TEST_DIR).mkdir(parents=True, exist_ok=True)
         create_system_user(TEST_USER, TEST_DIR)
         # Second call should succeed without error
         create_system_user(TEST_USER, TEST_DIR)
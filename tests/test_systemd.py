@@ -8,42 +8,45 @@ from __future__ import annotations
 
 import os
 import subprocess
-import tempfile
 from collections.abc import Generator
 
 import pytest
 
-pytestmark = pytest.mark.e2e
+pytestmark = [
+    pytest.mark.e2e,
+    pytest.mark.skipif(
+        not os.environ.get("MCTOMQTT_TEST_SYSTEMD"),
+        reason="Set MCTOMQTT_TEST_SYSTEMD=1 to run",
+    ),
+]
 
 SERVICE_NAME = "mctomqtt-test"
 UNIT_PATH = f"/etc/systemd/system/{SERVICE_NAME}.service"
 
 
-@pytest.fixture(autouse=True)
-def require_systemd() -> None:
-    if not os.environ.get("MCTOMQTT_TEST_SYSTEMD"):
-        pytest.skip("Set MCTOMQTT_TEST_SYSTEMD=1 to run")
-
-
 @pytest.fixture(autouse=True)
 def cleanup_service() -> Generator[None, None, None]:
-    """Ensure test service is removed after each test."""
+    """Stop and disable the test service after each test."""
     yield
+    # disable --now stops and disables in one systemctl call
     subprocess.run(
-        ["sudo", "systemctl", "stop", f"{SERVICE_NAME}.service"],
-        capture_output=True, check=False,
-    )
-    subprocess.run(
-        ["sudo", "systemctl", "disable", f"{SERVICE_NAME}.service"],
-        capture_output=True, check=False,
+        ["sudo", "systemctl", "disable", "--now", f"{SERVICE_NAME}.service"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
     )
+
+
+@pytest.fixture(scope="class")
+def installed_unit() -> Generator[None, None, None]:
+    """Install the test unit once per class and remove it afterwards."""
+    _install_test_unit()
+    yield
     subprocess.run(
         ["sudo", "rm", "-f", UNIT_PATH],
-        capture_output=True, check=False,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
     )
     subprocess.run(
         ["sudo", "systemctl", "daemon-reload"],
-        capture_output=True, check=False,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False,
     )
 
 
@@ -60,18 +63,16 @@ Restart=always
 [Install]
 WantedBy=multi-user.target
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".service", delete=False) as f:
-        f.write(unit_content)
-        tmp_path = f.name
-
-    subprocess.run(["sudo", "cp", tmp_path, UNIT_PATH], check=True)
-    os.unlink(tmp_path)
+    # Pipe the unit through sudo tee instead of a temp file + sudo cp
+    subprocess.run(
+        ["sudo", "tee", UNIT_PATH],
+        input=unit_content, text=True, stdout=subprocess.DEVNULL, check=True,
+    )
     subprocess.run(["sudo", "systemctl", "daemon-reload"], check=True)
 
 
 class TestSystemdService:
-    def test_install_and_enable(self) -> None:
-        _install_test_unit()
+    def test_install_and_enable(self, installed_unit: None) -> None:
         subprocess.run(
             ["sudo", "systemctl", "enable", f"{SERVICE_NAME}.service"],
             check=True,
@@ -83,8 +84,7 @@ class TestSystemdService:
         )
         assert result.stdout.strip() == "enabled"
 
-    def test_start_and_active(self) -> None:
-        _install_test_unit()
+    def test_start_and_active(self, installed_unit: None) -> None:
         subprocess.run(
             ["sudo", "systemctl", "enable", "--now", f"{SERVICE_NAME}.service"],
             check=True,
@@ -96,8 +96,7 @@ class TestSystemdService:
         )
         assert result.stdout.strip() == "active"
 
-    def test_stop_and_disable_clean(self) -> None:
-        _install_test_unit()
+    def test_stop_and_disable_clean(self, installed_unit: None) -> None:
         subprocess.run(
             ["sudo", "systemctl", "enable", "--now", f"{SERVICE_NAME}.service"],
             check=True,
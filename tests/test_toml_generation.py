@@ -2,24 +2,21 @@
 
 from __future__ import annotations
 
+import pytest
+
 from installer.config import _companions_to_toml_array, _iata_api_url, toml_escape
 
 
 class TestTomlEscape:
-    def test_plain_string_unchanged(self) -> None:
-        assert toml_escape("hello world") == "hello world"
-
-    def test_backslash_doubled(self) -> None:
-        assert toml_escape("path\\to\\file") == "path\\\\to\\\\file"
-
-    def test_double_quote_escaped(self) -> None:
-        assert toml_escape('say "hello"') == 'say \\"hello\\"'
-
-    def test_both_backslash_and_quote(self) -> None:
-        assert toml_escape('a\\b"c') == 'a\\\\b\\"c'
-
-    def test_empty_string(self) -> None:
-        assert toml_escape("") == ""
+    @pytest.mark.parametrize("raw, expected", [
+        pytest.param("hello world", "hello world", id="plain_string_unchanged"),
+        pytest.param("path\\to\\file", "path\\\\to\\\\file", id="backslash_doubled"),
+        pytest.param('say "hello"', 'say \\"hello\\"', id="double_quote_escaped"),
+        pytest.param('a\\b"c', 'a\\\\b\\"c', id="both_backslash_and_quote"),
+        pytest.param("", "", id="empty_string"),
+    ])
+    def test_escape(self, raw: str, expected: str) -> None:
+        assert toml_escape(raw) == expected
 
 
 class TestCompanionsToTomlArray:
@@ -69,6 +69,18 @@ class TestGetTopic:
         result = get_topic(state, "packets", broker_idx=0)
         assert result == f"meshrank/uplink/xxxxxx/{pubkey}/packets"
 
+    def test_caches_resolved_topic(self):
+        state = make_test_state(repeater_pub_key="AA" * 32)
+        first = get_topic(state, "packets", broker_idx=0)
+        assert state.topic_cache[("packets", 0, "AA" * 32)] == first
+        assert get_topic(state, "packets", broker_idx=0) is first
+
+    def test_pubkey_change_bypasses_cache(self):
+        state = make_test_state(repeater_pub_key=None)
+        assert get_topic(state, "packets") == "meshcore/TST/UNKNOWN/packets"
+        state.repeater_pub_key = "BB" * 32
+        assert get_topic(state, "packets") == f"meshcore/TST/{'BB' * 32}/packets"
+
 
 class TestSanitizeClientId:
     def test_alphanumeric(self):
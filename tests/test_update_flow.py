@@ -34,8 +34,7 @@ class TestUpdateFlow:
         assert content == user_toml_content
 
         # Verify it's valid TOML
-        with open(config_d / "99-user.toml", "rb") as f:
-            data = tomllib.load(f)
+        data = tomllib.loads(content)
         assert data["general"]["iata"] == "SEA"
         assert data["serial"]["ports"] == ["/dev/ttyACM0"]
 
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import urllib.error
+from collections.abc import Generator
 from unittest.mock import patch
 
 from pathlib import Path
 
+import pytest
+
 from installer import InstallerContext
 from installer.config import (
+    _iata_name_cache,
     _lookup_iata_code_with_retry,
     _configure_token_preset_overrides,
     configure_mqtt_brokers,
@@ -18,97 +22,58 @@ from installer.config import (
 )
 
 
-class TestValidateMeshcorePubkey:
-    def test_valid_64_hex_chars(self) -> None:
-        key = "A" * 64
-        assert validate_meshcore_pubkey(key) == key
+@pytest.fixture(autouse=True)
+def clear_iata_cache() -> Generator[None, None, None]:
+    _iata_name_cache.clear()
+    yield
+    _iata_name_cache.clear()
 
-    def test_lowercase_returns_uppercase(self) -> None:
-        key = "a" * 64
-        assert validate_meshcore_pubkey(key) == "A" * 64
 
-    def test_strips_spaces(self) -> None:
-        key = "A" * 32 + " " + "B" * 32
+class TestValidateMeshcorePubkey:
+    @pytest.mark.parametrize("key, expected", [
+        pytest.param("A" * 64, "A" * 64, id="valid_64_hex_chars"),
+        pytest.param("a" * 64, "A" * 64, id="lowercase_returns_uppercase"),
         # After stripping space and uppercasing: 32 A's + 32 B's = 64
-        assert validate_meshcore_pubkey(key) == "A" * 32 + "B" * 32
-
-    def test_63_chars_returns_none(self) -> None:
-        assert validate_meshcore_pubkey("A" * 63) is None
-
-    def test_65_chars_returns_none(self) -> None:
-        assert validate_meshcore_pubkey("A" * 65) is None
-
-    def test_non_hex_g_returns_none(self) -> None:
-        assert validate_meshcore_pubkey("G" * 64) is None
-
-    def test_non_hex_z_returns_none(self) -> None:
-        assert validate_meshcore_pubkey("Z" * 64) is None
-
-    def test_empty_string_returns_none(self) -> None:
-        assert validate_meshcore_pubkey("") is None
-
-    def test_all_zeros_valid(self) -> None:
-        assert validate_meshcore_pubkey("0" * 64) == "0" * 64
-
-    def test_all_fs_valid(self) -> None:
-        assert validate_meshcore_pubkey("F" * 64) == "F" * 64
-
-    def test_mixed_hex_valid(self) -> None:
-        key = "0123456789ABCDEFabcdef0123456789ABCDEF0123456789abcdef0123456789"
-        result = validate_meshcore_pubkey(key)
-        assert result is not None
-        assert result == key.replace(" ", "").upper()
+        pytest.param("A" * 32 + " " + "B" * 32, "A" * 32 + "B" * 32, id="strips_spaces"),
+        pytest.param("A" * 63, None, id="63_chars"),
+        pytest.param("A" * 65, None, id="65_chars"),
+        pytest.param("G" * 64, None, id="non_hex_g"),
+        pytest.param("Z" * 64, None, id="non_hex_z"),
+        pytest.param("", None, id="empty_string"),
+        pytest.param("0" * 64, "0" * 64, id="all_zeros"),
+        pytest.param("F" * 64, "F" * 64, id="all_fs"),
+        pytest.param(
+            "0123456789ABCDEFabcdef0123456789ABCDEF0123456789abcdef0123456789",
+            "0123456789ABCDEFABCDEF0123456789ABCDEF0123456789ABCDEF0123456789",
+            id="mixed_hex",
+        ),
+    ])
+    def test_validate(self, key: str, expected: str | None) -> None:
+        assert validate_meshcore_pubkey(key) == expected
 
 
 class TestValidateEmail:
-    def test_basic_valid(self) -> None:
-        assert validate_email("user@example.com") == "user@example.com"
-
-    def test_uppercase_lowercased(self) -> None:
-        assert validate_email("USER@EXAMPLE.COM") == "user@example.com"
-
-    def test_missing_at_returns_none(self) -> None:
-        assert validate_email("userexample.com") is None
-
-    def test_missing_dot_in_domain_returns_none(self) -> None:
-        assert validate_email("user@examplecom") is None
-
-    def test_starts_with_dot_returns_none(self) -> None:
-        assert validate_email(".user@example.com") is None
-
-    def test_starts_with_at_returns_none(self) -> None:
-        assert validate_email("@example.com") is None
-
-    def test_ends_with_dot_returns_none(self) -> None:
-        assert validate_email("user@example.com.") is None
-
-    def test_ends_with_at_returns_none(self) -> None:
-        assert validate_email("user@") is None
-
-    def test_double_dot_returns_none(self) -> None:
-        assert validate_email("user@example..com") is None
-
-    def test_space_returns_none(self) -> None:
-        assert validate_email("us er@example.com") is None
-
-    def test_empty_local_returns_none(self) -> None:
-        # "@example.com" starts with @, caught by starts_with check
-        assert validate_email("@example.com") is None
-
-    def test_domain_too_short_returns_none(self) -> None:
+    @pytest.mark.parametrize("email, expected", [
+        pytest.param("user@example.com", "user@example.com", id="basic_valid"),
+        pytest.param("USER@EXAMPLE.COM", "user@example.com", id="uppercase_lowercased"),
+        pytest.param("userexample.com", None, id="missing_at"),
+        pytest.param("user@examplecom", None, id="missing_dot_in_domain"),
+        pytest.param(".user@example.com", None, id="starts_with_dot"),
+        # Also covers the empty local part
+        pytest.param("@example.com", None, id="starts_with_at"),
+        pytest.param("user@example.com.", None, id="ends_with_dot"),
+        pytest.param("user@", None, id="ends_with_at"),
+        pytest.param("user@example..com", None, id="double_dot"),
+        pytest.param("us er@example.com", None, id="space"),
         # domain "b" is 1 char < 3
-        assert validate_email("a@b") is None
-
-    def test_minimal_valid_3char_domain(self) -> None:
-        # a@b.c -> domain "b.c" is 3 chars, has dot — valid
-        assert validate_email("a@b.c") == "a@b.c"
-
-    def test_minimal_valid(self) -> None:
-        # a@bc.d -> domain is "bc.d" (4 chars), has dot
-        assert validate_email("a@bc.d") == "a@bc.d"
-
-    def test_no_dot_in_domain_returns_none(self) -> None:
-        assert validate_email("a@bc") is None
+        pytest.param("a@b", None, id="domain_too_short"),
+        # domain "b.c" is 3 chars, has dot
+        pytest.param("a@b.c", "a@b.c", id="minimal_valid_3char_domain"),
+        pytest.param("a@bc.d", "a@bc.d", id="minimal_valid"),
+        pytest.param("a@bc", None, id="no_dot_in_domain"),
+    ])
+    def test_validate(self, email: str, expected: str | None) -> None:
+        assert validate_email(email) == expected
 
 
 class TestPromptIataLetsmesh:
@@ -147,6 +112,18 @@ class TestLookupIataCodeWithRetry:
         ):
             assert _lookup_iata_code_with_retry("SEA", attempts=2) == (None, True)
 
+    def test_successful_lookup_is_cached(self) -> None:
+        with patch("installer.config._iata_request", return_value=b'{"name": "Seattle-Tacoma"}') as request:
+            assert _lookup_iata_code_with_retry("SEA") == ("Seattle-Tacoma", False)
+            assert _lookup_iata_code_with_retry("SEA") == ("Seattle-Tacoma", False)
+        assert request.call_count == 1
+
+    def test_miss_is_not_cached(self) -> None:
+        with patch("installer.config._iata_request", return_value=b'{}') as request:
+            assert _lookup_iata_code_with_retry("ZZZ") == (None, False)
+            assert _lookup_iata_code_with_retry("ZZZ") == (None, False)
+        assert request.call_count == 2
+
 
 class TestTokenPresetOwnerPrompt:
     def test_shows_preset_and_current_owner_info(self, tmp_path) -> None:
@@ -12,33 +12,30 @@ from installer.system import create_venv
 pytestmark = pytest.mark.system
 
 
-class TestCreateVenv:
-    def test_creates_venv(self, tmp_path: Path) -> None:
-        install_dir = str(tmp_path / "mctomqtt")
-        (tmp_path / "mctomqtt").mkdir()
-        create_venv(install_dir, "")
+@pytest.fixture(scope="module")
+def install_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create one venv for the module; pip install dominates each test otherwise."""
+    install_dir = tmp_path_factory.mktemp("venv") / "mctomqtt"
+    install_dir.mkdir()
+    create_venv(str(install_dir), "")
+    return install_dir
 
-        venv_python = tmp_path / "mctomqtt" / "venv" / "bin" / "python3"
-        assert venv_python.exists()
 
-    def test_venv_has_dependencies(self, tmp_path: Path) -> None:
-        install_dir = str(tmp_path / "mctomqtt")
-        (tmp_path / "mctomqtt").mkdir()
-        create_venv(install_dir, "")
+class TestCreateVenv:
+    def test_creates_venv(self, install_dir: Path) -> None:
+        venv_python = install_dir / "venv" / "bin" / "python3"
+        assert venv_python.exists()
 
-        venv_python = str(tmp_path / "mctomqtt" / "venv" / "bin" / "python3")
+    def test_venv_has_dependencies(self, install_dir: Path) -> None:
+        venv_python = str(install_dir / "venv" / "bin" / "python3")
         result = subprocess.run(
             [venv_python, "-c", "import serial, paho.mqtt.client"],
             capture_output=True, text=True,
         )
         assert result.returncode == 0, f"Import failed: {result.stderr}"
 
-    def test_idempotent(self, tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
-        install_dir = str(tmp_path / "mctomqtt")
-        (tmp_path / "mctomqtt").mkdir()
-        create_venv(install_dir, "")
-
-        # Second call should detect existing venv
-        create_venv(install_dir, "")
+    def test_idempotent(self, install_dir: Path, capsys: pytest.CaptureFixture[str]) -> None:
+        # The fixture made the first call; this one should detect the venv
+        create_venv(str(install_dir), "")
         captured = capsys.readouterr()
         assert "existing virtual environment" in captured.out.lower()